@@ -1,11 +1,25 @@
 """OJMicroline Thermostat platform configuration."""
 
+import homeassistant.helpers.config_validation as cv
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-
-from .const import CONF_MODEL, CONFIG_FLOW_VERSION, DOMAIN, MODEL_WD5_SERIES
+from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_ENERGY_STATISTICS,
+    CONF_MODEL,
+    CONF_TELEMETRY,
+    CONF_ZONE_ENTITIES,
+    CONFIG_FLOW_VERSION,
+    DOMAIN,
+    MODEL_WD5_SERIES,
+)
 from .coordinator import OJMicrolineDataUpdateCoordinator
+from .services import async_setup_services
+from .storage import OJMicrolineSnapshotStore
+from .websocket_api import async_setup_websocket_api
 
 PLATFORMS = [
     Platform.CLIMATE,
@@ -13,6 +27,26 @@ PLATFORMS = [
     Platform.BINARY_SENSOR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Register the services and websocket commands of the integration.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        config: The YAML configuration, which is not used.
+
+    Returns:
+    -------
+        Return true after setting up.
+
+    """
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up OJMicroline as config entry.
@@ -30,14 +64,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     coordinator = OJMicrolineDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    # Start from the thermostats saved during the previous run, if any, so
+    # a slow or unreachable API does not hold up startup.
+    restored = await coordinator.async_restore()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_options))
+
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {entry.title}"
+        )
 
     return True
 
 
+async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when an option read at setup was toggled.
+
+    The other options are read whenever they are used.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        entry: The ConfigEntry whose options changed.
+
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    if (
+        bool(entry.options.get(CONF_ZONE_ENTITIES)) != coordinator.zone_entities
+        or bool(entry.options.get(CONF_TELEMETRY))
+        != (coordinator.telemetry is not None)
+        or bool(entry.options.get(CONF_ENERGY_STATISTICS))
+        != (coordinator.energy_statistics is not None)
+    ):
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry.
 
@@ -56,6 +122,46 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored thermostats of a deleted config entry.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        entry: The ConfigEntry that was removed.
+
+    """
+    await OJMicrolineSnapshotStore(hass, entry.entry_id).async_remove()
+
+
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> bool:
+    """Allow removing a thermostat or zone that is no longer in the account.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        entry: The ConfigEntry the device belongs to.
+        device: The device to remove.
+
+    Returns:
+    -------
+        True if none of the device's identifiers is a current thermostat
+        or zone.
+
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    zones = {coordinator.zone_identifier(zone_id) for zone_id in coordinator.zones}
+    return not any(
+        identifier in coordinator.data
+        or identifier == entry.entry_id
+        or identifier in zones
+        for domain, identifier in device.identifiers
+        if domain == DOMAIN
+    )
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate config entries from previous versions."""
     if config_entry.version > CONFIG_FLOW_VERSION:
@@ -1,24 +1,119 @@
 """Helper to construct OJMicroline objects."""
 
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from aiohttp import ClientSession
+from homeassistant.const import (
+    CONF_API_KEY,
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
-from ojmicroline_thermostat import WD5API, WG4API, OJMicroline
-
-from .const import CONF_CUSTOMER_ID, CONF_MODEL, MODEL_WD5_SERIES, MODEL_WG4_SERIES
+from .client import OJMicrolineClient, TolerantWD5API, TolerantWG4API
+from .const import (
+    CONF_CUSTOMER_ID,
+    CONF_MODEL,
+    DATA_LOGGED_IN_CLIENTS,
+    DATA_SESSIONS,
+    MODEL_WD5_SERIES,
+    MODEL_WG4_SERIES,
+)
+from .tracing import OJMicrolineRequestTracer
 
 
 def oj_microline_from_config_entry_data(
     data: dict[str, Any], hass: HomeAssistant
-) -> OJMicroline:
-    """Construct an OJMicroline object from the given config entry data."""
-    return OJMicroline(
-        api=_api_from_config_entry_data(data),
-        session=async_create_clientsession(hass),
-    )
+) -> OJMicrolineClient:
+    """Construct an OJMicroline object from the given config entry data.
+
+    If the config flow just logged in with the same data, its client is
+    reused so setup does not log in a second time.
+    """
+    clients = hass.data.get(DATA_LOGGED_IN_CLIENTS, {})
+    if (client := clients.pop(_account_key(data), None)) is not None:
+        return client  # type: ignore[no-any-return]
+    api = _api_from_config_entry_data(data)
+    return OJMicrolineClient(api=api, session=_acquire_session(hass, api.host))
+
+
+@dataclass
+class _SharedSession:
+    """An HTTP session shared by every client talking to the same host."""
+
+    session: ClientSession
+    tracer: OJMicrolineRequestTracer
+    unsub_close: CALLBACK_TYPE
+    users: int = 0
+
+
+def _acquire_session(hass: HomeAssistant, host: str) -> ClientSession:
+    """Return the shared HTTP session for a host, creating it if needed.
+
+    Sessions are created through Home Assistant, so they use its shared
+    connection pool with keep-alive and DNS caching. Their requests are
+    traced, see request_tracer.
+    """
+    sessions: dict[str, _SharedSession] = hass.data.setdefault(DATA_SESSIONS, {})
+    if (shared := sessions.get(host)) is None:
+        tracer = OJMicrolineRequestTracer()
+        session = async_create_clientsession(
+            hass, auto_cleanup=False, trace_configs=[tracer.trace_config]
+        )
+
+        @callback
+        def _async_detach(_event: Event) -> None:
+            session.detach()
+
+        shared = sessions[host] = _SharedSession(
+            session,
+            tracer,
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_detach),
+        )
+    shared.users += 1
+    return shared.session
+
+
+def request_tracer(
+    data: dict[str, Any], hass: HomeAssistant
+) -> OJMicrolineRequestTracer:
+    """Return the request statistics of the session used for the given data.
+
+    The statistics are shared by all config entries on the same host.
+    """
+    host = _api_from_config_entry_data(data).host
+    return hass.data[DATA_SESSIONS][host].tracer  # type: ignore[no-any-return]
+
+
+@callback
+def release_session(data: dict[str, Any], hass: HomeAssistant) -> None:
+    """Release the HTTP session of a client constructed from the given data.
+
+    The session is closed when its last client releases it.
+    """
+    host = _api_from_config_entry_data(data).host
+    sessions: dict[str, _SharedSession] = hass.data[DATA_SESSIONS]
+    shared = sessions[host]
+    shared.users -= 1
+    if shared.users == 0:
+        del sessions[host]
+        shared.unsub_close()
+        shared.session.detach()
+
+
+def keep_logged_in_client(
+    data: dict[str, Any], hass: HomeAssistant, client: OJMicrolineClient
+) -> None:
+    """Keep a logged in client for the config entry created from the data."""
+    hass.data.setdefault(DATA_LOGGED_IN_CLIENTS, {})[_account_key(data)] = client
+
+
+def _account_key(data: dict[str, Any]) -> tuple[Any, ...]:
+    return (data[CONF_MODEL], data.get(CONF_HOST), data[CONF_USERNAME])
 
 
 def _api_from_config_entry_data(data: dict[str, Any]) -> Any:
@@ -30,7 +125,7 @@ def _api_from_config_entry_data(data: dict[str, Any]) -> Any:
 
     model = data[CONF_MODEL]
     if model == MODEL_WD5_SERIES:
-        return WD5API(
+        return TolerantWD5API(
             username=data[CONF_USERNAME],
             password=data[CONF_PASSWORD],
             api_key=data[CONF_API_KEY],
@@ -38,7 +133,7 @@ def _api_from_config_entry_data(data: dict[str, Any]) -> Any:
             **extra_args,
         )
     if model == MODEL_WG4_SERIES:
-        return WG4API(
+        return TolerantWG4API(
             username=data[CONF_USERNAME],
             password=data[CONF_PASSWORD],
             **extra_args,
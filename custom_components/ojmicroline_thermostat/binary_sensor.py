@@ -9,11 +9,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.core import callback
 
 from .const import DOMAIN
 from .models import OJMicrolineEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Collection  # pylint: disable=import-error
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -59,15 +62,23 @@ async def async_setup_entry(
 
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
-    for idx in coordinator.data.keys():  # noqa: SIM118
-        for description in BINARY_SENSOR_TYPES:
-            # Different models of thermostat support different sensors;
-            # skip creating entities if the value is None.
-            if getattr(coordinator.data[idx], description.key) is not None:
-                entities.append(OJMicrolineBinarySensor(coordinator, idx, description))  # noqa: PERF401
 
-    async_add_entities(entities)
+    @callback
+    def _async_add_binary_sensors(serials: Collection[str]) -> None:
+        entities = []
+        for idx in serials:
+            for description in BINARY_SENSOR_TYPES:
+                # Different models of thermostat support different sensors;
+                # skip creating entities if the value is None.
+                if getattr(coordinator.data[idx], description.key) is not None:
+                    entities.append(  # noqa: PERF401
+                        OJMicrolineBinarySensor(coordinator, idx, description)
+                    )
+        async_add_entities(entities)
+
+    entry.async_on_unload(
+        coordinator.async_add_device_listener(_async_add_binary_sensors)
+    )
 
 
 class OJMicrolineBinarySensor(OJMicrolineEntity, BinarySensorEntity):
@@ -93,17 +104,15 @@ class OJMicrolineBinarySensor(OJMicrolineEntity, BinarySensorEntity):
         super().__init__(coordinator, idx)
 
         self.entity_description = entity_description
+        self.source_fields = frozenset({entity_description.key})
 
         self._attr_unique_id = f"{idx}_{entity_description.key}"
         self._attr_name = f"{coordinator.data[idx].name} {entity_description.name}"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return the status of the binary sensor.
-
-        Returns
-        -------
-            True if the sensor is on, false if not, unknown if it can't be reached.
-
-        """
-        return getattr(self.coordinator.data[self.idx], self.entity_description.key)
+        self._async_update_attrs()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Store the status of the binary sensor."""
+        self._attr_is_on = getattr(
+            self.coordinator.data[self.idx], self.entity_description.key
+        )
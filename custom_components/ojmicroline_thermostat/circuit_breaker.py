@@ -0,0 +1,198 @@
+"""Stop polling a failing OJ Microline API for a while."""
+
+from __future__ import annotations
+
+import logging
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.util import dt as dt_util
+
+from ojmicroline_thermostat import OJMicrolineTimeoutError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BreakerState(StrEnum):
+    """The states of the circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class BackoffPolicy:
+    """How the breaker reacts to a kind of failure.
+
+    A timeout usually means the API is overloaded, so it is allowed to
+    happen twice before the breaker opens, and the breaker then backs off
+    further. Connection and other errors open the breaker immediately but
+    retry sooner.
+    """
+
+    # Consecutive failures before the breaker opens.
+    threshold: int
+    # Seconds to wait after the breaker opens for the first time.
+    initial: float
+    # Upper bound of the wait, in seconds.
+    maximum: float
+
+
+TIMEOUT_POLICY = BackoffPolicy(threshold=2, initial=60, maximum=1800)
+ERROR_POLICY = BackoffPolicy(threshold=1, initial=30, maximum=900)
+
+
+class OJMicrolineCircuitBreaker:
+    """Track API failures and decide when to try the API again.
+
+    While closed, every request is allowed. Once the policy's threshold of
+    consecutive failures is reached the breaker opens, and requests are
+    refused until a jittered, exponentially growing delay has passed.
+    Then a single request is let through as a probe (half open) and all
+    others are refused while it runs: if it succeeds the breaker closes,
+    otherwise it opens again with a longer delay.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialise the breaker.
+
+        Args:
+        ----
+            name: The name used in log messages.
+
+        """
+        self.name = name
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.retry_at: datetime | None = None
+        # Number of times the breaker opened since the last success.
+        self._trips = 0
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call a function whenever the state or the failure count changes.
+
+        The coordinator only notifies its listeners when an update starts
+        or stops failing, so the breaker keeps its own listeners.
+
+        Args:
+        ----
+            update_callback: The function to call.
+
+        Returns:
+        -------
+            A function that removes the listener.
+
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify(self) -> None:
+        """Call all listeners."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @property
+    def closed(self) -> bool:
+        """Return whether requests other than the probe may be sent.
+
+        Returns
+        -------
+            True unless the breaker is open or waiting for its probe.
+
+        """
+        return self.state is BreakerState.CLOSED
+
+    def allow_request(self) -> bool:
+        """Check whether the API may be called now.
+
+        Once the delay has passed, the first caller gets to send the probe
+        and must report its outcome with record_success, record_failure or
+        release_probe.
+
+        Returns
+        -------
+            False while the breaker is open and the delay has not passed,
+            or while the probe is running.
+
+        """
+        if self.state is BreakerState.CLOSED:
+            return True
+        if self.state is BreakerState.HALF_OPEN or (
+            self.retry_at is not None and dt_util.utcnow() < self.retry_at
+        ):
+            return False
+        self.state = BreakerState.HALF_OPEN
+        self._async_notify()
+        return True
+
+    def release_probe(self) -> None:
+        """Let another request probe after one ended without an outcome."""
+        if self.state is BreakerState.HALF_OPEN:
+            self.state = BreakerState.OPEN
+            self._async_notify()
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        if self.state is not BreakerState.CLOSED:
+            _LOGGER.info("The OJ Microline API is reachable again for %s", self.name)
+        if not self.failures:
+            return
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.retry_at = None
+        self._trips = 0
+        self._async_notify()
+
+    def record_failure(self, error: Exception) -> timedelta | None:
+        """Count a failed request and open the breaker if needed.
+
+        Args:
+        ----
+            error: The error the request failed with.
+
+        Returns:
+        -------
+            The delay until the next request is allowed, or None if the
+            breaker is still closed.
+
+        """
+        self.failures += 1
+        policy = (
+            TIMEOUT_POLICY
+            if isinstance(error, OJMicrolineTimeoutError | TimeoutError)
+            else ERROR_POLICY
+        )
+        if self.state is BreakerState.CLOSED and self.failures < policy.threshold:
+            self._async_notify()
+            return None
+
+        self._trips += 1
+        seconds = min(policy.maximum, policy.initial * 2 ** (self._trips - 1))
+        # Equal jitter: wait at least half the delay, so accounts that
+        # failed together do not all retry at the same moment.
+        seconds = seconds / 2 + random.uniform(0, seconds / 2)  # noqa: S311
+        delay = timedelta(seconds=seconds)
+
+        if self.state is BreakerState.CLOSED:
+            _LOGGER.warning(
+                "The OJ Microline API is unavailable for %s, retrying in %s: %s",
+                self.name,
+                delay,
+                error,
+            )
+        self.state = BreakerState.OPEN
+        self.retry_at = dt_util.utcnow() + delay
+        self._async_notify()
+        return delay
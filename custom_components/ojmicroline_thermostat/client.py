@@ -0,0 +1,207 @@
+"""OJ Microline client that reads as many thermostats as it can."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ojmicroline_thermostat import (
+    WD5API,
+    WG4API,
+    OJMicroline,
+    OJMicrolineAuthError,
+    OJMicrolineError,
+    Thermostat,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from aiohttp import ClientSession
+
+    from ojmicroline_thermostat.ojmicroline import OJMicrolineAPI
+
+
+class _TolerantParser:
+    """Parse the thermostats of a response one by one.
+
+    The library parses all thermostats of an account at once, so a single
+    thermostat with an unexpected payload fails the whole account. The
+    thermostats that cannot be parsed are left out and listed in errors.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialise the API object and its list of errors."""
+        super().__init__(*args, **kwargs)
+        # Errors of the most recent response, by serial number.
+        self.errors: dict[str, Exception] = {}
+
+    def _parse_items(
+        self,
+        items: Iterable[dict[str, Any]],
+        from_json: Callable[[dict[str, Any]], Thermostat],
+    ) -> list[Thermostat]:
+        """Parse every thermostat of a response that can be parsed.
+
+        Args:
+        ----
+            items: The thermostat payloads.
+            from_json: The function parsing a single payload.
+
+        Returns:
+        -------
+            The thermostats that were parsed.
+
+        """
+        self.errors = {}
+        results: list[Thermostat] = []
+        for item in items:
+            try:
+                results.append(from_json(item))
+            except (KeyError, TypeError, ValueError) as error:
+                self.errors[str(item.get("SerialNumber"))] = error
+        return results
+
+
+class TolerantWD5API(_TolerantParser, WD5API):
+    """WD5API that skips thermostats it cannot parse."""
+
+    def parse_thermostats_response(self, data: Any) -> list[Thermostat]:
+        """Parse the thermostats, leaving out the ones that fail.
+
+        Args:
+        ----
+            data: The GroupContents response.
+
+        Returns:
+        -------
+            The thermostats that were parsed.
+
+        """
+        if data["ErrorCode"] == 1:
+            # Let the library raise its error for a failed response.
+            return super().parse_thermostats_response(data)
+        return self._parse_items(
+            (
+                item
+                for group in data["GroupContents"]
+                for item in group["Thermostats"]
+                if len(item)
+            ),
+            Thermostat.from_wd5_json,
+        )
+
+
+class TolerantWG4API(_TolerantParser, WG4API):
+    """WG4API that skips thermostats it cannot parse."""
+
+    def parse_thermostats_response(self, data: Any) -> list[Thermostat]:
+        """Parse the thermostats, leaving out the ones that fail.
+
+        Args:
+        ----
+            data: The thermostats response.
+
+        Returns:
+        -------
+            The thermostats that were parsed.
+
+        """
+        return self._parse_items(
+            (
+                item
+                for group in data["Groups"]
+                for item in group["Thermostats"]
+                if len(item)
+            ),
+            Thermostat.from_wg4_json,
+        )
+
+
+class OJMicrolineClient(OJMicroline):
+    """OJMicroline client that keeps going when a single thermostat fails.
+
+    Besides the parse errors of the API object, a failing energy usage
+    request is recorded instead of failing the whole account; the
+    thermostat is then returned without energy usage.
+    """
+
+    def __init__(self, api: OJMicrolineAPI, session: ClientSession) -> None:
+        """Initialise the client.
+
+        Args:
+        ----
+            api: The API object of the thermostat model.
+            session: The HTTP session to use.
+
+        """
+        super().__init__(api=api, session=session)
+        self._api = api
+        self._energy_errors: dict[str, Exception] = {}
+        # Number of login requests sent, for diagnostics.
+        self.logins = 0
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        """Return the errors of the most recent get_thermostats call.
+
+        Returns
+        -------
+            The errors by serial number.
+
+        """
+        return {**getattr(self._api, "errors", {}), **self._energy_errors}
+
+    async def _request(self, uri: str, **kwargs: Any) -> Any:
+        """Send a request, counting the logins.
+
+        login is called before every request, but only sends a request once
+        the session expired.
+
+        Args:
+        ----
+            uri: The request path.
+            **kwargs: The method, params and body of the request.
+
+        Returns:
+        -------
+            The JSON response.
+
+        """
+        if uri == self._api.login_path:
+            self.logins += 1
+        return await super()._request(uri, **kwargs)
+
+    async def get_thermostats(self) -> list[Thermostat]:
+        """Get all thermostats that could be read.
+
+        Returns
+        -------
+            A list of Thermostat objects.
+
+        """
+        self._energy_errors = {}
+        return await super().get_thermostats()
+
+    async def get_energy_usage(self, resource: Thermostat) -> list[float]:
+        """Get the energy usage, recording an error instead of raising it.
+
+        Args:
+        ----
+            resource: The Thermostat model.
+
+        Returns:
+        -------
+            The energy usage, or an empty list if it could not be fetched.
+
+        Raises:
+        ------
+            OJMicrolineAuthError: The session is no longer valid.
+
+        """
+        try:
+            return await super().get_energy_usage(resource)
+        except OJMicrolineAuthError:
+            raise
+        except OJMicrolineError as error:
+            self._energy_errors[resource.serial_number] = error
+            return []
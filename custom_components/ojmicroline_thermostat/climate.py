@@ -2,7 +2,13 @@
 
 import asyncio
 import logging
-from collections.abc import Mapping  # pylint: disable=import-error
+from abc import abstractmethod
+from collections.abc import (  # pylint: disable=import-error
+    Awaitable,
+    Collection,
+    Mapping,
+)
+from time import monotonic
 from typing import Any, ClassVar
 
 from homeassistant.components.climate import (
@@ -18,7 +24,8 @@ from homeassistant.components.climate.const import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -36,15 +43,19 @@ from ojmicroline_thermostat.const import (
 
 from .const import (
     CONF_COMFORT_MODE_DURATION,
+    CONF_MODEL,
     CONF_USE_COMFORT_MODE,
     DOMAIN,
     MANUFACTURER,
+    MODEL_WD5_SERIES,
     PRESET_FROST_PROTECTION,
     PRESET_MANUAL,
     PRESET_SCHEDULE,
     PRESET_VACATION,
+    WRITE_CONFIRM_DELAYS,
 )
-from .coordinator import OJMicrolineDataUpdateCoordinator
+from .coordinator import OJMicrolineDataUpdateCoordinator, ZoneSummary
+from .models import OJMicrolineEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,7 +68,7 @@ VENDOR_TO_HA_STATE = {
     REGULATION_BOOST: PRESET_BOOST,
     REGULATION_ECO: PRESET_ECO,
 }
-HA_TO_VENDOR_STATE = {v: k for k, v in VENDOR_TO_HA_STATE.items()}
+HA_TO_VENDOR_STATE: dict[str, int] = {v: k for k, v in VENDOR_TO_HA_STATE.items()}
 
 
 async def async_setup_entry(
@@ -73,20 +84,66 @@ async def async_setup_entry(
 
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
-    for idx in coordinator.data:
-        entities.append(  # noqa: PERF401
-            OJMicrolineThermostat(
-                coordinator=coordinator, idx=idx, options=entry.options
+
+    @callback
+    def _async_add_thermostats(serials: Collection[str]) -> None:
+        entities = []
+        for idx in serials:
+            entities.append(  # noqa: PERF401
+                OJMicrolineThermostat(
+                    coordinator=coordinator, idx=idx, options=entry.options
+                )
+            )
+        async_add_entities(entities)
+
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_thermostats))
+
+    if not coordinator.zone_entities:
+        _async_remove_zone_devices(hass, entry)
+        return
+
+    zone_ids: set[int] = set()
+
+    @callback
+    def _async_add_zones() -> None:
+        # Zones can appear when thermostats are added to the account.
+        if new := coordinator.zones.keys() - zone_ids:
+            zone_ids.update(new)
+            async_add_entities(
+                OJMicrolineZone(coordinator, zone_id, entry.options)
+                for zone_id in sorted(new)
             )
-        )
-    async_add_entities(entities)
 
+    _async_add_zones()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_zones))
 
-class OJMicrolineThermostat(
+
+@callback
+def _async_remove_zone_devices(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the zones left over from when the zone entities were enabled.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        entry: The ConfigEntry the zones belong to.
+
+    """
+    registry = dr.async_get(hass)
+    prefix = f"{entry.entry_id}_zone_"
+    for device in dr.async_entries_for_config_entry(registry, entry.entry_id):
+        if any(
+            domain == DOMAIN and identifier.startswith(prefix)
+            for domain, identifier in device.identifiers
+        ):
+            registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
+
+class OJMicrolineClimateEntity(
     CoordinatorEntity[OJMicrolineDataUpdateCoordinator], ClimateEntity
 ):
-    """OJMicrolineThermostat climate."""
+    """Show writes optimistically until a refresh confirms them."""
 
     _attr_hvac_modes: ClassVar[list[HVACMode]] = [HVACMode.HEAT]
     _attr_hvac_mode = HVACMode.HEAT
@@ -95,11 +152,251 @@ class OJMicrolineThermostat(
     )
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_has_entity_name = True
+
+    options: Mapping[str, Any]
+    # Values of a write that the backend has not reported yet.
+    _pending: dict[str, Any]
+    # When the pending write was submitted, for the command latency.
+    _submitted_at: float | None
+    _confirm_task: asyncio.Task[None] | None
+
+    def __init__(self, coordinator: OJMicrolineDataUpdateCoordinator) -> None:
+        """Initialise the entity.
+
+        Args:
+        ----
+            coordinator: The data coordinator updating the models.
+
+        """
+        super().__init__(coordinator)
+        self._pending = {}
+        self._submitted_at = None
+        self._confirm_task = None
+
+    @property
+    @abstractmethod
+    def display_name(self) -> str:
+        """Return the name of the thermostat or zone, for log messages.
+
+        Returns
+        -------
+            The name as known by the API.
+
+        """
+
+    @property
+    def preset_mode(self) -> str | None:
+        """Return the current preset mode, e.g., schedule, manual.
+
+        Returns
+        -------
+            The preset mode in a string format.
+
+        """
+        if "preset_mode" in self._pending:
+            return self._pending["preset_mode"]  # type: ignore[no-any-return]
+        return self._attr_preset_mode
+
+    @property
+    def target_temperature(self) -> float | None:
+        """Return target temperature.
+
+        Returns
+        -------
+            The target temperature in a float format.
+
+        """
+        if "target_temperature" in self._pending:
+            return self._pending["target_temperature"]  # type: ignore[no-any-return]
+        return self._attr_target_temperature
+
+    @callback
+    def _async_set_pending(self, **values: Any) -> None:
+        """Optimistically show the values of a write before it is confirmed.
+
+        Args:
+        ----
+            **values: The expected property values, e.g. preset_mode.
+
+        """
+        if self._confirm_task is not None:
+            self._confirm_task.cancel()
+            self._confirm_task = None
+        self._pending = values
+        self._submitted_at = monotonic()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_clear_pending(self) -> None:
+        """Drop the optimistic values and show the coordinator data again."""
+        self._pending = {}
+        self._submitted_at = None
+        self.async_write_ha_state()
+
+    @callback
+    def _async_confirm_pending(self, refreshed: Awaitable[None] | None = None) -> None:
+        """Start waiting for the backend to confirm the pending values.
+
+        Args:
+        ----
+            refreshed: A refresh shared by several writes, awaited instead
+                of the first one of WRITE_CONFIRM_DELAYS, or None.
+
+        """
+        if self._submitted_at is not None:
+            self.coordinator.command_latency.async_record_acknowledged(
+                monotonic() - self._submitted_at
+            )
+        self._confirm_task = self.hass.async_create_background_task(
+            self._async_confirm_write(refreshed),
+            f"{DOMAIN} confirm write {self.unique_id}",
+        )
+
+    async def async_write_pending(
+        self,
+        write: Awaitable[None],
+        *,
+        refreshed: Awaitable[None] | None = None,
+        **values: Any,
+    ) -> None:
+        """Show the values of a write until it is confirmed or fails.
+
+        Used by the entity's own writes and by the bulk services, so both
+        show, confirm and roll back writes the same way.
+
+        Args:
+        ----
+            write: Sends the write, e.g. through the command queue; it can
+                be shared by the entities a single write applies to.
+            refreshed: A refresh the caller runs once all of its writes
+                were sent, to confirm them together; None to refresh after
+                the first of WRITE_CONFIRM_DELAYS.
+            **values: The expected property values, e.g. preset_mode.
+
+        Raises:
+        ------
+            OJMicrolineError: The write failed; the values were dropped.
+
+        """
+        self._async_set_pending(**values)
+        try:
+            await write
+        except OJMicrolineError:
+            self.coordinator.command_latency.async_record_failed()
+            self._async_clear_pending()
+            raise
+        self._async_confirm_pending(refreshed)
+
+    @abstractmethod
+    def _pending_confirmed(self) -> bool:
+        """Check whether the coordinator data matches the pending values.
+
+        Returns
+        -------
+            True if every pending value is reported by the backend.
+
+        """
+
+    async def _async_confirm_write(
+        self, refreshed: Awaitable[None] | None = None
+    ) -> None:
+        """Refresh with backoff until the backend reports the pending values.
+
+        Refreshing immediately after an API call can return stale data,
+        probably due to DB propagation on the API backend; 1 second was
+        verified to be too short.
+
+        The *ideal* fix would be to switch away from polling; the API
+        does support some sort of HTTP-long-poll notification mechanism.
+        However, the ojmicroline-thermostat client does not expose it (it
+        only offers login, get_thermostats, get_energy_usage and
+        set_regulation_mode), so push updates have to be added there first.
+
+        Until then, refresh after each of WRITE_CONFIRM_DELAYS unless a
+        poll confirmed the values in the meantime; _async_check_pending
+        cancels this task as soon as they show up. Writes of a burst are
+        sent together by the command queue and their entities join the
+        same refresh, see async_confirm_refresh. Only if the values are
+        still missing after the last refresh has completed, roll back to
+        the reported state.
+
+        Args:
+        ----
+            refreshed: A refresh shared by several writes, awaited instead
+                of the first one of WRITE_CONFIRM_DELAYS, or None.
+
+        """
+        delays: tuple[int, ...] = WRITE_CONFIRM_DELAYS
+        if refreshed is not None:
+            # Cancelling this task must not cancel the refresh others share.
+            await asyncio.shield(refreshed)
+            if not self._pending:
+                return
+            delays = delays[1:]
+        for delay in delays:
+            await asyncio.sleep(delay)
+            if not self._pending:
+                return
+            await self.coordinator.async_confirm_refresh()
+            if not self._pending:
+                return
+
+        _LOGGER.warning(
+            '"%s" did not confirm %s, showing the reported state',
+            self.display_name,
+            self._pending,
+        )
+        self._confirm_task = None
+        self.coordinator.command_latency.async_record_rolled_back()
+        self._async_clear_pending()
+
+    @callback
+    def _async_check_pending(self) -> None:
+        """Drop the pending values once the coordinator data confirms them."""
+        if self._pending and self._pending_confirmed():
+            if self._submitted_at is not None:
+                self.coordinator.command_latency.async_record_confirmed(
+                    monotonic() - self._submitted_at
+                )
+            self._pending = {}
+            self._submitted_at = None
+            # Stop refreshing for a write that is confirmed.
+            if (
+                self._confirm_task is not None
+                and self._confirm_task is not asyncio.current_task()
+            ):
+                self._confirm_task.cancel()
+            self._confirm_task = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop waiting for write confirmations when the entity is removed."""
+        if self._confirm_task is not None:
+            self._confirm_task.cancel()
+        await super().async_will_remove_from_hass()
+
+    async def async_set_hvac_mode(
+        self,
+        hvac_mode: str,  # pylint: disable=unused-argument  # noqa: ARG002
+    ) -> bool:
+        """Set new hvac mode.
+
+        Always ignore; we only support HEATING mode.
+
+        Args:
+        ----
+            hvac_mode: Currently not used.
+
+        """
+        return True
+
+
+class OJMicrolineThermostat(OJMicrolineEntity, OJMicrolineClimateEntity):
+    """OJMicrolineThermostat climate."""
+
     _attr_name = None
     _attr_translation_key = "ojthermostat"
 
     idx: str
-    options: Mapping[str, Any]
 
     def __init__(
         self,
@@ -116,10 +413,21 @@ class OJMicrolineThermostat(
             options: The options provided by the user.
 
         """
-        super().__init__(coordinator)
-        self.idx = idx
+        super().__init__(coordinator, idx)
         self.options = options
         self._attr_unique_id = self.idx
+        self._async_update_attrs()
+
+    @property
+    def display_name(self) -> str:
+        """Return the name of the thermostat, for log messages.
+
+        Returns
+        -------
+            The name as known by the API.
+
+        """
+        return self.coordinator.data[self.idx].name
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -139,114 +447,250 @@ class OJMicrolineThermostat(
             model=self.coordinator.data[self.idx].model,
         )
 
-    @property
-    def preset_modes(self) -> list[str] | None:
-        """Return a list of available preset modes.
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Store the values of the thermostat."""
+        thermostat = self.coordinator.data[self.idx]
+        self._attr_preset_modes = [
+            VENDOR_TO_HA_STATE[mode] for mode in thermostat.supported_regulation_modes
+        ]
+        self._attr_preset_mode = VENDOR_TO_HA_STATE.get(thermostat.regulation_mode)
+        self._attr_current_temperature = thermostat.get_current_temperature() / 100
+        self._attr_target_temperature = thermostat.get_target_temperature() / 100
+        self._attr_max_temp = thermostat.max_temperature / 100
+        self._attr_min_temp = thermostat.min_temperature / 100
+        if thermostat.heating:
+            self._attr_hvac_action = HVACAction.HEATING
+        elif thermostat.online:
+            self._attr_hvac_action = HVACAction.IDLE
+        else:
+            self._attr_hvac_action = HVACAction.OFF
 
-        Returns
-        -------
-            A list of supported preset modes in string format.
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set new preset mode.
+
+        Args:
+        ----
+            preset_mode: The preset mode to set the thermostat to.
 
         """
-        return [
-            VENDOR_TO_HA_STATE[mode]
-            for mode in self.coordinator.data[self.idx].supported_regulation_modes
-        ]
+        try:
+            await self.async_write_pending(
+                self.coordinator.commands.async_set_regulation_mode(
+                    self.idx,
+                    HA_TO_VENDOR_STATE[preset_mode],
+                ),
+                preset_mode=preset_mode,
+            )
+        except OJMicrolineError:
+            _LOGGER.exception(
+                'Failed setting preset mode "%s" (%s)',
+                self.coordinator.data[self.idx].name,
+                preset_mode,
+            )
 
-    @property
-    def preset_mode(self) -> str:
-        """Return the current preset mode, e.g., schedule, manual.
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Set new temperature.
 
-        Returns
-        -------
-            The preset mode in a string format.
+        Args:
+        ----
+            **kwargs: All arguments passed to the method.
 
         """
-        return VENDOR_TO_HA_STATE.get(self.coordinator.data[self.idx].regulation_mode)  # type: ignore[return-value]
+        if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
+            return
 
-    @property
-    def current_temperature(self) -> float:
-        """Return current temperature.
+        regulation_mode = self.coordinator.data[self.idx].regulation_mode
+
+        if regulation_mode not in {REGULATION_MANUAL, REGULATION_COMFORT}:
+            regulation_mode = (
+                REGULATION_COMFORT
+                if self.options.get(CONF_USE_COMFORT_MODE)
+                else REGULATION_MANUAL
+            )
+
+        await self.async_write_pending(
+            self.coordinator.commands.async_set_regulation_mode(
+                self.idx,
+                regulation_mode=regulation_mode,
+                temperature=int(temperature * 100),
+                duration=self.options.get(CONF_COMFORT_MODE_DURATION),
+            ),
+            preset_mode=VENDOR_TO_HA_STATE[regulation_mode],
+            target_temperature=int(temperature * 100) / 100,
+        )
+
+    def _pending_confirmed(self) -> bool:
+        """Check whether the coordinator data matches the pending values.
 
         Returns
         -------
-            The current temperature in a float format..
+            True if every pending value is reported by the backend.
 
         """
-        return self.coordinator.data[self.idx].get_current_temperature() / 100
-
-    @property
-    def target_temperature(self) -> float:
-        """Return target temperature.
+        thermostat = self.coordinator.data[self.idx]
+        actual = {
+            "preset_mode": VENDOR_TO_HA_STATE.get(thermostat.regulation_mode),
+            "target_temperature": thermostat.get_target_temperature() / 100,
+        }
+        return all(actual[key] == value for key, value in self._pending.items())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self.idx in self.coordinator.data:
+            self._async_check_pending()
+        super()._handle_coordinator_update()
+
+    def _has_source_changes(self) -> bool:
+        """Check whether the thermostat changed since the last update.
 
         Returns
         -------
-            The target temperature in a float format.
+            True if any field changed, or if the target temperature follows
+            the schedule and may have changed with time.
+
+        """
+        if self.coordinator.data[self.idx].regulation_mode in {
+            REGULATION_SCHEDULE,
+            REGULATION_ECO,
+        }:
+            return True
+        return self.coordinator.has_changed(self.idx)
+
+
+class OJMicrolineZone(OJMicrolineClimateEntity):
+    """All thermostats of a zone as one climate entity.
+
+    The state is read from the zone the coordinator aggregates once per
+    update. A write is queued for every member at once, so the command
+    queue sends them as one burst. WD5 thermostats are written per zone by
+    the API, so there a single write covers the whole zone.
+    """
+
+    _attr_name = None
+    _attr_translation_key = "zone"
+
+    zone_id: int
+    _summary: ZoneSummary | None
+
+    def __init__(
+        self,
+        coordinator: OJMicrolineDataUpdateCoordinator,
+        zone_id: int,
+        options: Mapping[str, Any],
+    ) -> None:
+        """Initialise the entity.
+
+        Args:
+        ----
+            coordinator: The data coordinator updating the zones.
+            zone_id: The ID of the zone.
+            options: The options provided by the user.
 
         """
-        return self.coordinator.data[self.idx].get_target_temperature() / 100
+        super().__init__(coordinator)
+        self.options = options
+        self.zone_id = zone_id
+        self._attr_unique_id = coordinator.zone_identifier(zone_id)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._attr_unique_id)},
+            manufacturer=MANUFACTURER,
+            name=coordinator.zones[zone_id].name,
+            model="Zone",
+            via_device=(DOMAIN, coordinator.entry.entry_id),
+        )
+        self._summary = None
+        self._async_update_attrs()
 
     @property
-    def max_temp(self) -> float:
-        """Return max temperature.
+    def display_name(self) -> str:
+        """Return the name of the zone, for log messages.
 
         Returns
         -------
-            The max temperature in a float format.
+            The name as known by the API.
 
         """
-        return self.coordinator.data[self.idx].max_temperature / 100
+        return self._summary.name if self._summary else str(self.zone_id)
 
     @property
-    def min_temp(self) -> float:
-        """Return min temperature.
+    def available(self) -> bool:
+        """Return whether the zone still has thermostats.
 
         Returns
         -------
-            The min temperature in a float format.
+            True if the last update succeeded and the zone has thermostats.
 
         """
-        return self.coordinator.data[self.idx].min_temperature / 100
+        return super().available and self.zone_id in self.coordinator.zones
 
     @property
-    def hvac_action(self) -> HVACAction | None:
-        """Indicates whether the thermostat is currently heating.
+    def assumed_state(self) -> bool:
+        """Return whether any member shows a state not confirmed by the API.
 
         Returns
         -------
-            The HVACAction.
+            True if the data was restored from storage, or a member could
+            not be read and shows its last good snapshot.
 
         """
-        thermostat = self.coordinator.data[self.idx]
-        if thermostat.heating:
-            return HVACAction.HEATING
-        if thermostat.online:
-            return HVACAction.IDLE
-        return HVACAction.OFF
+        return self.coordinator.stale or any(
+            self.coordinator.is_stale(idx)
+            for idx in (self._summary.members if self._summary else ())
+        )
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Store the values of the zone."""
+        if (summary := self.coordinator.zones.get(self.zone_id)) is None:
+            return
+        self._summary = summary
+        self._attr_preset_modes = [
+            VENDOR_TO_HA_STATE[mode] for mode in summary.supported_regulation_modes
+        ]
+        self._attr_preset_mode = (
+            VENDOR_TO_HA_STATE.get(summary.regulation_mode)
+            if summary.regulation_mode is not None
+            else None
+        )
+        self._attr_current_temperature = summary.current_temperature
+        self._attr_target_temperature = summary.target_temperature
+        self._attr_max_temp = summary.max_temperature
+        self._attr_min_temp = summary.min_temperature
+        if summary.heating:
+            self._attr_hvac_action = HVACAction.HEATING
+        elif summary.online:
+            self._attr_hvac_action = HVACAction.IDLE
+        else:
+            self._attr_hvac_action = HVACAction.OFF
+        self._attr_extra_state_attributes = {
+            "min_current_temperature": summary.min_current_temperature,
+            "thermostats": len(summary.members),
+        }
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
-        """Set new preset mode.
+        """Set the preset mode of every thermostat in the zone.
 
         Args:
         ----
-            preset_mode: The preset mode to set the thermostat to.
+            preset_mode: The preset mode to set the thermostats to.
 
         """
         try:
-            await self.coordinator.api.set_regulation_mode(
-                self.coordinator.data[self.idx],
-                HA_TO_VENDOR_STATE.get(preset_mode),
+            await self.async_write_pending(
+                self._async_write(HA_TO_VENDOR_STATE[preset_mode]),
+                preset_mode=preset_mode,
             )
-            await self._async_delayed_request_refresh()
         except OJMicrolineError:
             _LOGGER.exception(
-                'Failed setting preset mode "%s" (%s)',
-                self.coordinator.data[self.idx].name,
+                'Failed setting preset mode of zone "%s" (%s)',
+                self.display_name,
                 preset_mode,
             )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
-        """Set new temperature.
+        """Set the temperature of every thermostat in the zone.
 
         Args:
         ----
@@ -256,7 +700,7 @@ class OJMicrolineThermostat(
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
 
-        regulation_mode = self.coordinator.data[self.idx].regulation_mode
+        regulation_mode = self.coordinator.zones[self.zone_id].regulation_mode
 
         if regulation_mode not in {REGULATION_MANUAL, REGULATION_COMFORT}:
             regulation_mode = (
@@ -265,41 +709,106 @@ class OJMicrolineThermostat(
                 else REGULATION_MANUAL
             )
 
-        await self.coordinator.api.set_regulation_mode(
-            resource=self.coordinator.data[self.unique_id],
-            regulation_mode=regulation_mode,
-            temperature=int(temperature * 100),
-            duration=self.options.get(CONF_COMFORT_MODE_DURATION),
+        await self.async_write_pending(
+            self._async_write(
+                regulation_mode,
+                temperature=int(temperature * 100),
+                duration=self.options.get(CONF_COMFORT_MODE_DURATION),
+            ),
+            preset_mode=VENDOR_TO_HA_STATE[regulation_mode],
+            target_temperature=int(temperature * 100) / 100,
         )
-        await self._async_delayed_request_refresh()
 
-    async def _async_delayed_request_refresh(self) -> None:
-        """Get delayed data from the coordinator.
+    async def _async_write(
+        self,
+        regulation_mode: int,
+        temperature: int | None = None,
+        duration: int | None = None,
+    ) -> None:
+        """Queue a regulation mode write for the members as one burst.
 
-        Refreshing immediately after an API call can return stale data,
-        probably due to DB propagation on the API backend.
+        Args:
+        ----
+            regulation_mode: The mode to set the thermostats to.
+            temperature: The temperature to set or None.
+            duration: The comfort mode duration in minutes or None.
 
-        The *ideal* fix would be to switch away from polling; the API
-        does support some sort of HTTP-long-poll notification mechanism.
+        Raises:
+        ------
+            OJMicrolineError: A write failed.
 
-        As a temporary band-aid, sleep for 2 seconds and then request a
-        refresh. Manual testing indicates this seems to work well enough;
-        1 second was verified to be too short.
         """
-        await asyncio.sleep(2)
-        await self.coordinator.async_request_refresh()
+        members = self.coordinator.zones[self.zone_id].members
+        if self.coordinator.entry.data[CONF_MODEL] == MODEL_WD5_SERIES:
+            members = members[:1]
+        results = await asyncio.gather(
+            *(
+                self.coordinator.commands.async_set_regulation_mode(
+                    idx, regulation_mode, temperature, duration
+                )
+                for idx in members
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
-    async def async_set_hvac_mode(
-        self,
-        hvac_mode: str,  # pylint: disable=unused-argument  # noqa: ARG002
-    ) -> bool:
-        """Set new hvac mode.
+    def _pending_confirmed(self) -> bool:
+        """Check whether the zone matches the pending values.
 
-        Always ignore; we only support HEATING mode.
+        Returns
+        -------
+            True if every member reports the pending values.
 
-        Args:
-        ----
-            hvac_mode: Currently not used.
+        """
+        if (summary := self.coordinator.zones.get(self.zone_id)) is None:
+            return False
+        actual = {
+            "preset_mode": (
+                VENDOR_TO_HA_STATE.get(summary.regulation_mode)
+                if summary.regulation_mode is not None
+                else None
+            ),
+            "target_temperature": summary.target_temperature,
+        }
+        return all(actual[key] == value for key, value in self._pending.items())
+
+    def _follows_schedule(self) -> bool:
+        """Check whether a member's target temperature follows the schedule.
+
+        Returns
+        -------
+            True if any member is in schedule or eco mode, so the target
+            temperature may have changed with time.
 
         """
-        return True
+        if self._summary is None:
+            return False
+        return any(
+            (thermostat := self.coordinator.data.get(idx)) is not None
+            and thermostat.regulation_mode in {REGULATION_SCHEDULE, REGULATION_ECO}
+            for idx in self._summary.members
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the zone or the pending values changed."""
+        summary = self.coordinator.zones.get(self.zone_id)
+        pending = bool(self._pending)
+        if summary is not None:
+            self._async_check_pending()
+        if (
+            self.coordinator.last_update_success
+            and summary == self._summary
+            and not self._follows_schedule()
+            and pending == bool(self._pending)
+        ):
+            self.coordinator.stats.skipped_writes += 1
+            return
+        self.coordinator.stats.state_writes += 1
+        self._async_update_attrs()
+        if not self.coordinator.last_update_success:
+            # Write the zone again once the updates succeed.
+            self._summary = None
+        super()._handle_coordinator_update()
@@ -0,0 +1,173 @@
+"""Coalesce thermostat writes before sending them to the OJ Microline API."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from ojmicroline_thermostat import OJMicrolineConnectionError, OJMicrolineError
+
+from .const import COMMAND_DEBOUNCE
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .coordinator import OJMicrolineDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingCommand:
+    """A regulation mode write that has not been sent yet.
+
+    Every field is overwritten by the latest write, including the ones it
+    leaves out, so the command that is eventually sent is the last write.
+    """
+
+    regulation_mode: int
+    temperature: int | None = None
+    duration: int | None = None
+    waiters: list[asyncio.Future[None]] = field(default_factory=list)
+    # Limits how many commands of a bulk service call are sent at once.
+    semaphore: asyncio.Semaphore | None = None
+
+
+class OJMicrolineCommandQueue:
+    """Queue regulation mode writes per thermostat.
+
+    Writes submitted within COMMAND_DEBOUNCE seconds of each other are
+    merged into a single set_regulation_mode call per thermostat, and all
+    thermostats of a burst are sent together. Writes fail right away while
+    the circuit breaker is not closed.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: OJMicrolineDataUpdateCoordinator
+    ) -> None:
+        """Initialise the queue.
+
+        Args:
+        ----
+            hass: The HomeAssistant instance.
+            coordinator: The coordinator holding the API and thermostats.
+
+        """
+        self.hass = hass
+        self.coordinator = coordinator
+        self._pending: dict[str, PendingCommand] = {}
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._flush_job = HassJob(self._async_flush, f"{coordinator.name} commands")
+
+    async def async_set_regulation_mode(
+        self,
+        idx: str,
+        regulation_mode: int,
+        temperature: int | None = None,
+        duration: int | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Queue a regulation mode write and wait until it has been sent.
+
+        Args:
+        ----
+            idx: The serial number of the thermostat.
+            regulation_mode: The mode to set the thermostat to.
+            temperature: The temperature to set or None.
+            duration: The comfort mode duration in minutes or None.
+            semaphore: Held while the write is sent, or None.
+
+        Raises:
+        ------
+            OJMicrolineError: The merged write failed.
+
+        """
+        command = self._pending.setdefault(idx, PendingCommand(regulation_mode))
+        command.regulation_mode = regulation_mode
+        command.temperature = temperature
+        command.duration = duration
+        if semaphore is not None:
+            command.semaphore = semaphore
+
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        command.waiters.append(waiter)
+
+        # Restart the timer on every write so a burst is sent as a whole.
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+        self._unsub_flush = async_call_later(
+            self.hass, COMMAND_DEBOUNCE, self._flush_job
+        )
+
+        await waiter
+
+    async def _async_flush(self, _now: datetime) -> None:
+        """Send all pending commands."""
+        self._unsub_flush = None
+        pending, self._pending = self._pending, {}
+        await asyncio.gather(
+            *(self._async_send(idx, command) for idx, command in pending.items())
+        )
+
+    async def _async_send(self, idx: str, command: PendingCommand) -> None:
+        """Send a single merged command and resolve its waiters.
+
+        Args:
+        ----
+            idx: The serial number of the thermostat.
+            command: The merged command.
+
+        """
+        kwargs: dict[str, Any] = {}
+        if command.duration is not None:
+            kwargs["duration"] = command.duration
+
+        error: Exception | None = None
+        breaker = self.coordinator.breaker
+        if (resource := self.coordinator.data.get(idx)) is None:
+            error = OJMicrolineError(f"Thermostat {idx} was removed")
+        elif not breaker.closed:
+            # Leave the failing API to the poll that probes it.
+            error = OJMicrolineConnectionError(
+                f"API unavailable until {breaker.retry_at}"
+            )
+        else:
+            try:
+                async with command.semaphore or contextlib.nullcontext():
+                    await self.coordinator.api.set_regulation_mode(
+                        resource=resource,
+                        regulation_mode=command.regulation_mode,
+                        temperature=command.temperature,
+                        **kwargs,
+                    )
+            except Exception as exception:  # pylint: disable=broad-except  # noqa: BLE001
+                # Raised again in every waiter; nothing is swallowed here.
+                error = exception
+
+        if len(command.waiters) > 1:
+            _LOGGER.debug("Merged %s writes for %s", len(command.waiters), idx)
+
+        for waiter in command.waiters:
+            if waiter.done():
+                continue
+            if error is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(error)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the pending flush and all waiting writes."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        for command in self._pending.values():
+            for waiter in command.waiters:
+                waiter.cancel()
+        self._pending = {}
@@ -16,17 +16,28 @@ from ojmicroline_thermostat import (
 )
 from ojmicroline_thermostat.const import COMFORT_DURATION
 
-from .api import oj_microline_from_config_entry_data
+from .api import (
+    keep_logged_in_client,
+    oj_microline_from_config_entry_data,
+    release_session,
+)
 from .const import (
     CONF_COMFORT_MODE_DURATION,
     CONF_CUSTOMER_ID,
+    CONF_ENERGY_STATISTICS,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
     CONF_MODEL,
+    CONF_TELEMETRY,
     CONF_USE_COMFORT_MODE,
+    CONF_ZONE_ENTITIES,
     CONFIG_FLOW_VERSION,
     DOMAIN,
     INTEGRATION_NAME,
     MODEL_WD5_SERIES,
     MODEL_WG4_SERIES,
+    UPDATE_INTERVAL_MAX,
+    UPDATE_INTERVAL_MIN,
 )
 
 DATA_SCHEMA = vol.Schema(
@@ -172,23 +183,26 @@ class OJMicrolineFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[call-ar
     ) -> FlowResult | None:
         """Validate the config entry data and logs in to the API.
 
-        If successful, calls async_create_entry and returns the FlowResult.
-        Otherwise, stores an error in the errors dict and returns None.
+        If successful, keeps the logged in client for the entry setup, calls
+        async_create_entry and returns the FlowResult. Otherwise, stores an
+        error in the errors dict and returns None.
         """
         data = DATA_SCHEMA(data)
+        # Disallow duplicate entries...
+        self._async_abort_entries_match(
+            {
+                k: data[k]
+                for k in data
+                # ... only considering model/host/username as
+                # distinguishing keys.
+                if k in [CONF_MODEL, CONF_HOST, CONF_USERNAME]
+            }
+        )
+        api = oj_microline_from_config_entry_data(data, self.hass)
+        logged_in = False
         try:
-            # Disallow duplicate entries...
-            self._async_abort_entries_match(
-                {
-                    k: data[k]
-                    for k in data
-                    # ... only considering model/host/username as
-                    # distinguishing keys.
-                    if k in [CONF_MODEL, CONF_HOST, CONF_USERNAME]
-                }
-            )
-            api = oj_microline_from_config_entry_data(data, self.hass)
             await api.login()
+            logged_in = True
         except OJMicrolineAuthError:
             errors["base"] = "invalid_auth"
         except OJMicrolineTimeoutError:
@@ -197,11 +211,17 @@ class OJMicrolineFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[call-ar
             errors["base"] = "connection_failed"
         except OJMicrolineError:
             errors["base"] = "unknown"
-        else:
-            return self.async_create_entry(
-                title=f"{INTEGRATION_NAME} ({data[CONF_USERNAME]})", data=data
-            )
-        return None
+        finally:
+            # The kept client holds on to the shared session; any failure,
+            # including unexpected errors and cancellation, releases it.
+            if not logged_in:
+                release_session(data, self.hass)
+        if not logged_in:
+            return None
+        keep_logged_in_client(data, self.hass, api)
+        return self.async_create_entry(
+            title=f"{INTEGRATION_NAME} ({data[CONF_USERNAME]})", data=data
+        )
 
 
 class OJMicrolineOptionsFlowHandler(OptionsFlow):
@@ -250,6 +270,34 @@ class OJMicrolineOptionsFlowHandler(OptionsFlow):
                             CONF_COMFORT_MODE_DURATION, COMFORT_DURATION
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_MIN_UPDATE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MIN_UPDATE_INTERVAL, UPDATE_INTERVAL_MIN
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                    vol.Optional(
+                        CONF_MAX_UPDATE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_UPDATE_INTERVAL, UPDATE_INTERVAL_MAX
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                    vol.Optional(
+                        CONF_ZONE_ENTITIES,
+                        default=self.config_entry.options.get(
+                            CONF_ZONE_ENTITIES, False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TELEMETRY,
+                        default=self.config_entry.options.get(CONF_TELEMETRY, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_ENERGY_STATISTICS,
+                        default=self.config_entry.options.get(
+                            CONF_ENERGY_STATISTICS, False
+                        ),
+                    ): bool,
                 }
             ),
         )
@@ -4,14 +4,68 @@ DOMAIN = "ojmicroline_thermostat"
 MANUFACTURER = "OJ Electronics"
 INTEGRATION_NAME = "OJ Microline Thermostat"
 CONFIG_FLOW_VERSION = 2
+STORAGE_VERSION = 1
+
+# hass.data key of clients logged in by the config flow, by account.
+DATA_LOGGED_IN_CLIENTS = f"{DOMAIN}_logged_in_clients"
+# hass.data key of the HTTP sessions shared by all clients, by host.
+DATA_SESSIONS = f"{DOMAIN}_sessions"
+# hass.data key of the poll scheduler shared by all config entries.
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
 
 API_TIMEOUT = 30
 UPDATE_INTERVAL = 60
+# Default poll interval bounds, in seconds, while thermostats are active/idle.
+UPDATE_INTERVAL_MIN = 30
+UPDATE_INTERVAL_MAX = 300
+# Number of config entries that may poll the API at the same time.
+MAX_CONCURRENT_UPDATES = 2
+# Seconds to wait after a boost, comfort or vacation boundary before refreshing.
+DEADLINE_REFRESH_DELAY = 5
+# Consecutive updates a thermostat must be missing from before it is removed.
+DEVICE_REMOVAL_UPDATES = 3
+# Seconds to wait before saving the latest thermostats to storage.
+SNAPSHOT_SAVE_DELAY = 5
+# Seconds to wait for more writes before sending them as one burst.
+COMMAND_DEBOUNCE = 0.5
+# Seconds to wait between refreshes while confirming a write.
+WRITE_CONFIRM_DELAYS = (2, 4, 8, 16)
+# Upper bounds, in seconds, of the buckets of the request latency histograms.
+REQUEST_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, API_TIMEOUT)
+# Number of API paths that get their own request statistics.
+MAX_TRACED_ENDPOINTS = 8
+# Number of recent updates the success rate in the diagnostics covers.
+UPDATE_HISTORY_SIZE = 20
+# Number of recent writes the command latency percentiles cover.
+COMMAND_LATENCY_SAMPLES = 100
+
+# Seconds between writes of the buffered telemetry rows.
+TELEMETRY_FLUSH_INTERVAL = 300
+# Buffered telemetry rows that are written right away.
+TELEMETRY_BATCH_ROWS = 5000
+# Size in bytes and age in seconds after which a new telemetry file is started.
+TELEMETRY_MAX_FILE_SIZE = 10 * 1024 * 1024
+TELEMETRY_ROTATE_INTERVAL = 24 * 60 * 60
+# Seconds between imports of the daily energy usage into the statistics.
+ENERGY_IMPORT_INTERVAL = 60 * 60
+
+# Writes a bulk service call sends at the same time, unless overridden.
+BULK_MAX_CONCURRENCY = 8
 
 CONF_MODEL = "model"
 CONF_CUSTOMER_ID = "customer_id"
 CONF_USE_COMFORT_MODE = "use_comfort_mode"
 CONF_COMFORT_MODE_DURATION = "comfort_mode_duration"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_ZONE_ENTITIES = "zone_entities"
+CONF_TELEMETRY = "telemetry"
+CONF_ENERGY_STATISTICS = "energy_statistics"
+
+SERVICE_BULK_SET_PRESET_MODE = "bulk_set_preset_mode"
+SERVICE_BULK_SET_TEMPERATURE = "bulk_set_temperature"
+ATTR_DURATION = "duration"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
 
 MODEL_WD5_SERIES = "WD5 series"
 MODEL_WG4_SERIES = "WG4 series"
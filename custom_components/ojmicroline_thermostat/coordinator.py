@@ -1,21 +1,141 @@
 """OJMicroline Thermostat platform configuration."""
 
+import asyncio
 import logging
-from datetime import timedelta
+from collections import deque
+from collections.abc import Callable, Collection  # pylint: disable=import-error
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Any
 
 import async_timeout
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from ojmicroline_thermostat import OJMicrolineAuthError, OJMicrolineError, Thermostat
+from ojmicroline_thermostat.const import (
+    REGULATION_BOOST,
+    REGULATION_COMFORT,
+    REGULATION_VACATION,
+)
 
-from .api import oj_microline_from_config_entry_data
-from .const import API_TIMEOUT, DOMAIN, UPDATE_INTERVAL
+from .api import oj_microline_from_config_entry_data, release_session, request_tracer
+from .circuit_breaker import OJMicrolineCircuitBreaker
+from .commands import OJMicrolineCommandQueue
+from .const import (
+    API_TIMEOUT,
+    CONF_ENERGY_STATISTICS,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_TELEMETRY,
+    CONF_ZONE_ENTITIES,
+    DEADLINE_REFRESH_DELAY,
+    DEVICE_REMOVAL_UPDATES,
+    DOMAIN,
+    UPDATE_HISTORY_SIZE,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_MAX,
+    UPDATE_INTERVAL_MIN,
+)
+from .energy import OJMicrolineEnergyStatistics
+from .scheduler import async_get_scheduler
+from .storage import OJMicrolineSnapshotStore
+from .telemetry import OJMicrolineTelemetry
+from .tracing import CommandLatencyTracker
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+
+@dataclass
+class UpdateStats:
+    """Counters of the most recent coordinator update."""
+
+    changed_thermostats: int = 0
+    state_writes: int = 0
+    skipped_writes: int = 0
+
+
+@dataclass
+class UpdateMetrics:
+    """Counters across all updates of the coordinator, for diagnostics."""
+
+    updates: int = 0
+    failures: int = 0
+    # Seconds the most recent update took, including waiting for a slot.
+    last_duration: float | None = None
+    # Outcomes of the most recent updates, True if it succeeded.
+    history: deque[bool] = field(
+        default_factory=lambda: deque(maxlen=UPDATE_HISTORY_SIZE)
+    )
+    # State writes of all updates that notified the entities.
+    state_writes: int = 0
+    notified_updates: int = 0
+
+    @property
+    def success_rate(self) -> float | None:
+        """Return the share of the most recent updates that succeeded.
+
+        Returns
+        -------
+            A value from 0 to 1, or None before the first update.
+
+        """
+        if not self.history:
+            return None
+        return sum(self.history) / len(self.history)
+
+    def record(self, success: bool, duration: float) -> None:  # noqa: FBT001
+        """Count an update.
+
+        Args:
+        ----
+            success: Whether the update succeeded.
+            duration: How long the update took, in seconds.
+
+        """
+        self.updates += 1
+        self.failures += not success
+        self.last_duration = duration
+        self.history.append(success)
+
+
+@dataclass
+class DeviceHealth:
+    """Errors of a single thermostat across updates."""
+
+    errors: int = 0
+    last_error: str | None = None
+    # Set while the last good snapshot is shown because reading it failed.
+    stale_since: datetime | None = None
+
+
+@dataclass(frozen=True)
+class ZoneSummary:
+    """Aggregated state of the thermostats in one zone, in degrees Celsius."""
+
+    name: str
+    # Serial numbers of the thermostats in the zone.
+    members: tuple[str, ...]
+    current_temperature: float
+    min_current_temperature: float
+    target_temperature: float
+    min_temperature: float
+    max_temperature: float
+    # The regulation mode all members are in, or None if they differ.
+    regulation_mode: int | None
+    # The regulation modes every member supports.
+    supported_regulation_modes: tuple[int, ...]
+    heating: bool
+    online: bool
+
 
 class OJMicrolineDataUpdateCoordinator(DataUpdateCoordinator):
     """Define an object to fetch data."""
@@ -35,9 +155,138 @@ class OJMicrolineDataUpdateCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
         )
+        self.entry = entry
         self.api = oj_microline_from_config_entry_data(entry.data, hass)
+        self.tracer = request_tracer(entry.data, hass)
+        self.command_latency = CommandLatencyTracker()
+        self.commands = OJMicrolineCommandQueue(hass, self)
+        self.store = OJMicrolineSnapshotStore(hass, entry.entry_id)
+        self.scheduler = async_get_scheduler(hass)
+        self.scheduler.async_register(self)
+        self.breaker = OJMicrolineCircuitBreaker(entry.title)
+        # True while the data was restored from storage and not refreshed yet.
+        self.stale = False
+        self._unsub_deadline: CALLBACK_TYPE | None = None
+        # Changed fields by serial number, None if everything changed.
+        self.changes: dict[str, set[str]] | None = None
+        self.stats = UpdateStats()
+        self.metrics = UpdateMetrics()
+        self.health: dict[str, DeviceHealth] = {}
+        # Serial numbers that appeared or disappeared in the last update.
+        self.added: set[str] = set()
+        self.removed: set[str] = set()
+        # Consecutive updates a known thermostat was missing from.
+        self._missing: dict[str, int] = {}
+        # When the energy usage of each thermostat was last read; its days
+        # count back from that moment, not from when it is used.
+        self.energy_read_at: dict[str, datetime] = {}
+        # Aggregated zones by zone ID, only kept with the zone entities
+        # option, which takes effect after reloading the entry.
+        self.zone_entities = bool(entry.options.get(CONF_ZONE_ENTITIES))
+        self.zones: dict[int, ZoneSummary] = {}
+        self.telemetry = (
+            OJMicrolineTelemetry(hass, entry.entry_id)
+            if entry.options.get(CONF_TELEMETRY)
+            else None
+        )
+        self.energy_statistics = (
+            OJMicrolineEnergyStatistics(hass)
+            if entry.options.get(CONF_ENERGY_STATISTICS)
+            else None
+        )
+        # Values shared by the thermostats, see _share_values.
+        self._schedules: dict[int, dict[str, Any]] = {}
+        self._mode_lists: dict[tuple[int, ...], list[int]] = {}
+        # The interval picked from the thermostat states, before the
+        # scheduler shifts the next poll onto this entry's phase.
+        self.poll_interval = timedelta(seconds=UPDATE_INTERVAL)
+        # The refresh the entities confirming a write are waiting for.
+        self._confirm_refresh: asyncio.Task[None] | None = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending writes and any scheduled refresh."""
+        self.commands.async_cancel()
+        if self._confirm_refresh is not None:
+            self._confirm_refresh.cancel()
+        self._async_unsub_deadline()
+        self.scheduler.async_unregister(self)
+        release_session(self.entry.data, self.hass)
+        if self.telemetry is not None:
+            await self.telemetry.async_stop()
+        await super().async_shutdown()
+
+    async def async_restore(self) -> bool:
+        """Restore the thermostats saved after the last successful update.
+
+        Returns
+        -------
+            True if thermostats were restored; they are marked stale until
+            the next successful update.
+
+        """
+        if (data := await self.store.async_load()) is None:
+            return False
+        self._share_values(data.values())
+        self.data = data
+        self.stale = True
+        self._update_zones()
+        return True
+
+    def _update_zones(self) -> None:
+        """Aggregate the zones if the zone entities are enabled."""
+        if self.zone_entities and self.data:
+            self.zones = _summarize_zones(self.data)
+        else:
+            self.zones = {}
+
+    def zone_identifier(self, zone_id: int) -> str:
+        """Return the device identifier of a zone.
+
+        Args:
+        ----
+            zone_id: The ID of the zone.
+
+        Returns:
+        -------
+            An identifier that is unique across accounts.
+
+        """
+        return f"{self.entry.entry_id}_zone_{zone_id}"
+
+    async def async_confirm_refresh(self) -> None:
+        """Refresh now and wait for it, sharing one refresh between callers.
+
+        Unlike async_request_refresh, which returns before a debounced
+        refresh runs, this returns once the data is up to date. Entities
+        confirming the writes of a burst call it at the same time, so they
+        join the refresh that is already running instead of starting one
+        each.
+        """
+        if self._confirm_refresh is None or self._confirm_refresh.done():
+            self._confirm_refresh = self.hass.async_create_task(
+                self.async_refresh(), f"{DOMAIN} confirm refresh"
+            )
+        # A cancelled waiter must not cancel the refresh the others share.
+        await asyncio.shield(self._confirm_refresh)
 
     async def _async_update_data(self) -> dict[str, Thermostat]:
+        """Fetch data from API endpoint and count the update in the metrics.
+
+        Returns
+        -------
+            The thermostats by serial number, see _async_fetch_data.
+
+        """
+        start = monotonic()
+        success = False
+        try:
+            data = await self._async_fetch_data()
+            success = True
+        finally:
+            self.metrics.record(success, monotonic() - start)
+        return data
+
+    async def _async_fetch_data(self) -> dict[str, Thermostat]:
         """Fetch data from API endpoint.
 
         This is the place to pre-process the data to lookup tables
@@ -51,16 +300,510 @@ class OJMicrolineDataUpdateCoordinator(DataUpdateCoordinator):
         Raises
         ------
             ConfigEntryAuthFailed: An invalid config was ued.
-            UpdateFailed: An error occurred when updating the data.
+            UpdateFailed: An error occurred when updating the data, or the
+                circuit breaker is open.
 
         """
+        self.added = set()
+        self.removed = set()
+        if not self.breaker.allow_request():
+            msg = f"API unavailable until {self.breaker.retry_at}"
+            raise UpdateFailed(msg)
+
         try:
-            async with async_timeout.timeout(API_TIMEOUT):
+            # Wait for a free slot before the timeout starts counting.
+            async with self.scheduler.semaphore, async_timeout.timeout(API_TIMEOUT):
                 thermostats = await self.api.get_thermostats()
-                return {resource.serial_number: resource for resource in thermostats}
 
         except OJMicrolineAuthError as error:
+            # The API answered, so it is reachable.
+            self.breaker.record_success()
             raise ConfigEntryAuthFailed from error
 
-        except OJMicrolineError as error:
+        except (OJMicrolineError, TimeoutError) as error:
+            # Poll again once the breaker lets requests through.
+            if (delay := self.breaker.record_failure(error)) is not None:
+                self.update_interval = delay
             raise UpdateFailed(error) from error
+
+        except BaseException:
+            self.breaker.release_probe()
+            raise
+
+        self.breaker.record_success()
+        stale = self._stale_devices()
+        previous = self.data or {}
+        self._share_values(thermostats)
+        data = self._merge(thermostats, dict(self.api.errors))
+        self.added = data.keys() - previous.keys() if self.data is not None else set()
+        self.removed = previous.keys() - data.keys()
+        self._async_remove_devices(self.removed)
+        self.changes = self._diff(data)
+        if self.changes is not None:
+            # Write every entity of a device that became stale or fresh.
+            for idx in (stale ^ self._stale_devices()) & data.keys():
+                self.changes[idx] = set(vars(data[idx]))
+        self.stale = False
+        if self.changes != {}:
+            self.store.async_save(data)
+        self.poll_interval = self._compute_update_interval(data)
+        self.update_interval = self.scheduler.async_align(
+            self.entry.entry_id, self.poll_interval
+        )
+        self._async_schedule_deadline(data)
+        return data
+
+    def _share_values(self, thermostats: Collection[Thermostat]) -> None:
+        """Let thermostats share equal schedules and regulation mode lists.
+
+        WD5 schedules belong to a zone, so every thermostat of a zone gets
+        its own copy of the same nested schedule, which is by far the
+        largest part of a thermostat. Equal copies are replaced by a single
+        shared one, kept across updates while it does not change. The
+        schedules are only read, e.g. to send them back with a write.
+
+        Args:
+        ----
+            thermostats: The thermostats to update in place.
+
+        """
+        schedules: dict[int, dict[str, Any]] = {}
+        for thermostat in thermostats:
+            if thermostat.schedule is not None:
+                zone_id = thermostat.zone_id
+                shared = schedules.get(zone_id, self._schedules.get(zone_id))
+                if shared == thermostat.schedule:
+                    thermostat.schedule = shared
+                schedules.setdefault(zone_id, thermostat.schedule)
+            modes = thermostat.supported_regulation_modes
+            thermostat.supported_regulation_modes = self._mode_lists.setdefault(
+                tuple(modes), modes
+            )
+        self._schedules = schedules
+
+    def _merge(
+        self, thermostats: list[Thermostat], errors: dict[str, Exception]
+    ) -> dict[str, Thermostat]:
+        """Combine the thermostats that were read with the last good ones.
+
+        A thermostat that could not be parsed, or whose values cannot be
+        computed, keeps its last good snapshot and is marked stale. If
+        only its energy usage failed, the last known usage is kept. A
+        thermostat missing from the response is kept the same way until it
+        has been missing for DEVICE_REMOVAL_UPDATES updates.
+
+        Args:
+        ----
+            thermostats: The thermostats returned by the API.
+            errors: The errors of the thermostats that failed, by serial
+                number.
+
+        Returns:
+        -------
+            The thermostats by serial number.
+
+        Raises:
+        ------
+            UpdateFailed: No thermostat could be read.
+
+        """
+        previous = self.data or {}
+        data: dict[str, Thermostat] = {}
+        for thermostat in thermostats:
+            idx = thermostat.serial_number
+            if idx in errors:
+                # Only the energy usage failed.
+                thermostat.energy = previous[idx].energy if idx in previous else None
+            try:
+                _validate(thermostat)
+            except (KeyError, TypeError, ValueError, AttributeError) as exception:
+                errors[idx] = exception
+                continue
+            data[idx] = thermostat
+
+        if errors and not data:
+            msg = f"No thermostat could be read: {errors}"
+            raise UpdateFailed(msg)
+
+        self._track_missing(
+            previous.keys() - {t.serial_number for t in thermostats}, errors
+        )
+
+        now = dt_util.utcnow()
+        for idx in data.keys() - errors.keys():
+            self.energy_read_at[idx] = now
+        for idx, error in errors.items():
+            health = self.health.setdefault(idx, DeviceHealth())
+            health.errors += 1
+            health.last_error = repr(error)
+            if idx not in data and idx in previous:
+                data[idx] = previous[idx]
+                if health.stale_since is None:
+                    _LOGGER.warning(
+                        'Showing the last known state of "%s": %s',
+                        previous[idx].name,
+                        error,
+                    )
+                    health.stale_since = now
+        for idx, health in self.health.items():
+            if idx not in errors:
+                health.stale_since = None
+        return data
+
+    @callback
+    def async_add_device_listener(
+        self, add_devices: Callable[[Collection[str]], None]
+    ) -> CALLBACK_TYPE:
+        """Pass the current thermostats and every thermostat added later.
+
+        Args:
+        ----
+            add_devices: The function creating the entities of thermostats,
+                called with their serial numbers.
+
+        Returns:
+        -------
+            A function that removes the listener.
+
+        """
+        add_devices(list(self.data))
+
+        @callback
+        def _async_add_new_devices() -> None:
+            if self.added:
+                add_devices(self.added)
+
+        return self.async_add_listener(_async_add_new_devices)
+
+    @callback
+    def _async_remove_devices(self, removed: set[str]) -> None:
+        """Remove the devices of thermostats that left the account.
+
+        Removing a device also removes its entities.
+
+        Args:
+        ----
+            removed: The serial numbers of the removed thermostats.
+
+        """
+        registry = dr.async_get(self.hass)
+        for idx in removed:
+            _LOGGER.info("Removing thermostat %s from %s", idx, self.entry.title)
+            if device := registry.async_get_device(identifiers={(DOMAIN, idx)}):
+                registry.async_update_device(
+                    device.id, remove_config_entry_id=self.entry.entry_id
+                )
+
+    def _track_missing(self, missing: set[str], errors: dict[str, Exception]) -> None:
+        """Count how many updates in a row thermostats were missing.
+
+        A thermostat that is missing from a few responses in a row has been
+        removed from the account; until then it is treated as failed.
+
+        Args:
+        ----
+            missing: The known serial numbers missing from the response.
+            errors: The errors by serial number, extended in place.
+
+        """
+        for idx in set(self._missing) - missing:
+            del self._missing[idx]
+        for idx in missing - errors.keys():
+            self._missing[idx] = self._missing.get(idx, 0) + 1
+            if self._missing[idx] < DEVICE_REMOVAL_UPDATES:
+                errors[idx] = LookupError("Missing from the response")
+            else:
+                del self._missing[idx]
+                self.health.pop(idx, None)
+                self.energy_read_at.pop(idx, None)
+
+    def _stale_devices(self) -> set[str]:
+        """Return the serial numbers of the thermostats shown stale."""
+        return {idx for idx, health in self.health.items() if health.stale_since}
+
+    def is_stale(self, idx: str) -> bool:
+        """Check whether a thermostat shows its last good snapshot.
+
+        Args:
+        ----
+            idx: The serial number of the thermostat.
+
+        Returns:
+        -------
+            True if the thermostat could not be read in the last update.
+
+        """
+        return (health := self.health.get(idx)) is not None and (
+            health.stale_since is not None
+        )
+
+    def _diff(self, data: dict[str, Thermostat]) -> dict[str, set[str]] | None:
+        """Compare the new thermostats with the previous ones field by field.
+
+        Args:
+        ----
+            data: The new thermostats by serial number.
+
+        Returns:
+        -------
+            The changed field names by serial number, leaving out unchanged
+            thermostats, or None if there is nothing valid to compare with
+            or the previous data was restored from storage.
+
+        """
+        if self.data is None or self.stale or not self.last_update_success:
+            return None
+
+        changes: dict[str, set[str]] = {}
+        for idx, thermostat in data.items():
+            previous = vars(self.data[idx]) if idx in self.data else {}
+            if changed := {
+                name
+                for name, value in vars(thermostat).items()
+                if previous.get(name, _MISSING) != value
+            }:
+                changes[idx] = changed
+        return changes
+
+    def has_changed(self, idx: str, fields: Collection[str] | None = None) -> bool:
+        """Check whether a thermostat changed in the most recent update.
+
+        Args:
+        ----
+            idx: The serial number of the thermostat.
+            fields: Only consider these fields, or any field if None.
+
+        Returns:
+        -------
+            True if any of the fields changed.
+
+        """
+        if self.changes is None:
+            return True
+        if (changed := self.changes.get(idx)) is None:
+            return False
+        return fields is None or not changed.isdisjoint(fields)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners and count how many of them wrote their state.
+
+        The zones are aggregated here, once per update, so the zone entities
+        only have to read them. They are aggregated even if no field
+        changed, as the target temperature of a member following its
+        schedule changes with time. The telemetry rows are buffered here too,
+        after the update, and written later, and the energy usage is
+        imported into the statistics in the background.
+        """
+        self._update_zones()
+        if self.last_update_success and not self.stale:
+            if self.telemetry is not None:
+                self.telemetry.async_record(self.data)
+            if self.energy_statistics is not None:
+                self.energy_statistics.async_schedule_import(
+                    self.data, self.energy_read_at
+                )
+        self.stats = UpdateStats(
+            changed_thermostats=len(self.data or {})
+            if self.changes is None
+            else len(self.changes)
+        )
+        super().async_update_listeners()
+        self.metrics.state_writes += self.stats.state_writes
+        self.metrics.notified_updates += 1
+        _LOGGER.debug(
+            "Updated %s: %s thermostats changed, %s states written, %s skipped",
+            self.entry.title,
+            self.stats.changed_thermostats,
+            self.stats.state_writes,
+            self.stats.skipped_writes,
+        )
+
+    def _compute_update_interval(self, data: dict[str, Thermostat]) -> timedelta:
+        """Pick the next poll interval based on what the thermostats are doing.
+
+        Poll at the configured minimum while any thermostat is active, and
+        back off to the configured maximum while all of them are idle,
+        offline or on vacation.
+
+        Args:
+        ----
+            data: The thermostats by serial number.
+
+        Returns:
+        -------
+            The interval until the next poll.
+
+        """
+        minimum = self.entry.options.get(CONF_MIN_UPDATE_INTERVAL, UPDATE_INTERVAL_MIN)
+        maximum = self.entry.options.get(CONF_MAX_UPDATE_INTERVAL, UPDATE_INTERVAL_MAX)
+        seconds = maximum
+        if any(_is_active(thermostat) for thermostat in data.values()):
+            seconds = minimum
+
+        interval = timedelta(seconds=max(seconds, minimum))
+        if interval != self.poll_interval:
+            _LOGGER.debug("Polling %s every %s", self.entry.title, interval)
+        return interval
+
+    @callback
+    def _async_schedule_deadline(self, data: dict[str, Thermostat]) -> None:
+        """Refresh right after the next boost, comfort or vacation boundary.
+
+        Only the earliest boundary across all thermostats is armed; every
+        update re-arms it. Boundaries after the next poll are left to that
+        poll.
+
+        Args:
+        ----
+            data: The thermostats by serial number.
+
+        """
+        self._async_unsub_deadline()
+
+        now = dt_util.utcnow()
+        deadline = min(
+            (
+                deadline
+                for thermostat in data.values()
+                for deadline in _deadlines(thermostat)
+                if deadline > now
+            ),
+            default=None,
+        )
+        if deadline is None or (
+            self.update_interval is not None and deadline > now + self.update_interval
+        ):
+            return
+
+        _LOGGER.debug("Refreshing %s after %s", self.entry.title, deadline)
+        self._unsub_deadline = async_track_point_in_utc_time(
+            self.hass,
+            self._async_handle_deadline,
+            deadline + timedelta(seconds=DEADLINE_REFRESH_DELAY),
+        )
+
+    async def _async_handle_deadline(self, _now: datetime) -> None:
+        """Refresh once a boundary has passed."""
+        self._unsub_deadline = None
+        await self.async_request_refresh()
+
+    @callback
+    def _async_unsub_deadline(self) -> None:
+        """Cancel the armed boundary refresh."""
+        if self._unsub_deadline is not None:
+            self._unsub_deadline()
+            self._unsub_deadline = None
+
+
+def _deadlines(thermostat: Thermostat) -> list[datetime]:
+    """List the moments at which the thermostat changes mode by itself.
+
+    Args:
+    ----
+        thermostat: The thermostat to check.
+
+    Returns:
+    -------
+        The end of boost or comfort mode, the end of the current vacation
+        or the begin of a scheduled one, when they apply.
+
+    """
+    deadlines: list[datetime | None] = []
+    if thermostat.regulation_mode == REGULATION_BOOST:
+        deadlines.append(thermostat.boost_end_time)
+    if thermostat.regulation_mode == REGULATION_COMFORT:
+        deadlines.append(thermostat.comfort_end_time)
+    # vacation_mode is also set while a vacation is only scheduled.
+    if thermostat.regulation_mode == REGULATION_VACATION:
+        deadlines.append(thermostat.vacation_end_time)
+    elif thermostat.vacation_mode:
+        deadlines.append(thermostat.vacation_begin_time)
+    return [deadline for deadline in deadlines if deadline is not None]
+
+
+def _summarize_zones(data: dict[str, Thermostat]) -> dict[int, ZoneSummary]:
+    """Aggregate the thermostats by zone.
+
+    Args:
+    ----
+        data: The thermostats by serial number.
+
+    Returns:
+    -------
+        The zones by zone ID, with the mean and lowest current temperature,
+        the mean target temperature, the limits every member allows, the
+        common regulation mode and whether any member is heating or online.
+
+    """
+    members: dict[int, list[Thermostat]] = {}
+    for thermostat in data.values():
+        members.setdefault(thermostat.zone_id, []).append(thermostat)
+
+    zones = {}
+    for zone_id, thermostats in members.items():
+        current = [t.get_current_temperature() / 100 for t in thermostats]
+        modes = {t.regulation_mode for t in thermostats}
+        supported = set.intersection(
+            *(set(t.supported_regulation_modes) for t in thermostats)
+        )
+        zones[zone_id] = ZoneSummary(
+            name=thermostats[0].zone_name,
+            members=tuple(sorted(t.serial_number for t in thermostats)),
+            current_temperature=round(sum(current) / len(current), 2),
+            min_current_temperature=min(current),
+            target_temperature=round(
+                sum(t.get_target_temperature() for t in thermostats)
+                / len(thermostats)
+                / 100,
+                2,
+            ),
+            min_temperature=max(t.min_temperature for t in thermostats) / 100,
+            max_temperature=min(t.max_temperature for t in thermostats) / 100,
+            regulation_mode=modes.pop() if len(modes) == 1 else None,
+            supported_regulation_modes=tuple(sorted(supported)),
+            heating=any(t.heating for t in thermostats),
+            online=any(t.online for t in thermostats),
+        )
+    return zones
+
+
+def _validate(thermostat: Thermostat) -> None:
+    """Compute the values the entities derive from a thermostat.
+
+    Args:
+    ----
+        thermostat: The thermostat to check.
+
+    Raises:
+    ------
+        ValueError: The thermostat has no serial number or name.
+
+    """
+    if not thermostat.serial_number or not thermostat.name:
+        msg = "Missing serial number or name"
+        raise ValueError(msg)
+    thermostat.get_current_temperature()
+    thermostat.get_target_temperature()
+
+
+def _is_active(thermostat: Thermostat) -> bool:
+    """Check whether a thermostat is in a state that changes quickly.
+
+    Args:
+    ----
+        thermostat: The thermostat to check.
+
+    Returns:
+    -------
+        True if the thermostat is heating, in comfort or boost mode or
+        has open window detection active.
+
+    """
+    if not thermostat.online or thermostat.regulation_mode == REGULATION_VACATION:
+        return False
+    return bool(
+        thermostat.heating
+        or thermostat.regulation_mode in {REGULATION_COMFORT, REGULATION_BOOST}
+        or thermostat.open_window_detection
+    )
@@ -0,0 +1,106 @@
+"""Diagnostics support for OJ Microline Thermostat."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_API_KEY, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.helpers import entity_registry as er
+
+from .const import CONF_CUSTOMER_ID, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import OJMicrolineDataUpdateCoordinator
+
+# The title contains the username.
+TO_REDACT = {CONF_API_KEY, CONF_CUSTOMER_ID, CONF_PASSWORD, CONF_USERNAME, "title"}
+# Thermostat fields that identify the thermostat or its location.
+THERMOSTAT_TO_REDACT = {"serial_number", "thermostat_id", "name", "zone_name"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Everything is read from counters the coordinator keeps anyway, so
+    collecting them costs nothing until the diagnostics are downloaded.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        entry: The ConfigEntry to describe.
+
+    Returns:
+    -------
+        The redacted config entry, the health of the coordinator, the
+        request statistics by endpoint, the command latencies and the
+        redacted thermostats.
+
+    """
+    coordinator: OJMicrolineDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+    metrics = coordinator.metrics
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_update_duration": metrics.last_duration,
+            "success_rate": metrics.success_rate,
+            "updates": metrics.updates,
+            "failed_updates": metrics.failures,
+            "consecutive_failures": coordinator.breaker.failures,
+            "api_status": coordinator.breaker.state,
+            "poll_interval": coordinator.poll_interval.total_seconds(),
+            # Seconds into the poll interval this entry polls at, so the
+            # entries of all accounts do not poll at the same time.
+            "poll_phase_offset": coordinator.scheduler.phase_offsets.get(
+                entry.entry_id
+            ),
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval is not None
+                else None
+            ),
+            "stale": coordinator.stale,
+            "thermostats": len(data),
+            "thermostats_with_errors": sum(
+                health.stale_since is not None for health in coordinator.health.values()
+            ),
+            "entities": len(
+                er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+            ),
+            "last_update": asdict(coordinator.stats),
+            "state_writes_per_update": (
+                metrics.state_writes / metrics.notified_updates
+                if metrics.notified_updates
+                else None
+            ),
+            "logins": coordinator.api.logins,
+        },
+        "requests": coordinator.tracer.as_dict(),
+        "commands": coordinator.command_latency.as_dict(),
+        "telemetry": (
+            {
+                "rows_written": coordinator.telemetry.rows_written,
+                "rows_failed": coordinator.telemetry.rows_failed,
+                "buffered": coordinator.telemetry.buffered,
+            }
+            if coordinator.telemetry is not None
+            else None
+        ),
+        "energy_statistics": (
+            {"imports": coordinator.energy_statistics.imports}
+            if coordinator.energy_statistics is not None
+            else None
+        ),
+        "thermostats": [
+            async_redact_data(asdict(thermostat), THERMOSTAT_TO_REDACT)
+            for thermostat in data.values()
+        ],
+    }
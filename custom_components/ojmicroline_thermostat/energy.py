@@ -0,0 +1,219 @@
+"""Import the daily energy usage of the thermostats into long-term statistics."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN, ENERGY_IMPORT_INTERVAL
+
+if TYPE_CHECKING:
+    from ojmicroline_thermostat import Thermostat
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OJMicrolineEnergyStatistics:
+    """Import the energy usage the API reports per day as external statistics.
+
+    WD5 thermostats report the usage of today and the six days before, so
+    each import also backfills the days Home Assistant was not running.
+    Every day is stored as one statistic at local midnight, with the
+    running sum the energy dashboard reads. A day is only imported again
+    when its usage changed; the recorder replaces statistics with the same
+    start, so importing a day twice is harmless.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the importer.
+
+        Args:
+        ----
+            hass: The HomeAssistant instance.
+
+        """
+        self.hass = hass
+        self.imports = 0
+        # The usage and sum of the imported days by serial number and start.
+        self._imported: dict[str, dict[float, tuple[float, float]]] = {}
+        self._last_import: float | None = None
+        self._importing = False
+
+    @staticmethod
+    def statistic_id(idx: str) -> str:
+        """Return the statistic ID of a thermostat.
+
+        Args:
+        ----
+            idx: The serial number of the thermostat.
+
+        Returns:
+        -------
+            The external statistic ID.
+
+        """
+        return f"{DOMAIN}:energy_{slugify(idx)}"
+
+    @callback
+    def async_schedule_import(
+        self, data: dict[str, Thermostat], read_at: dict[str, datetime]
+    ) -> None:
+        """Import in the background, at most every ENERGY_IMPORT_INTERVAL.
+
+        The first import after startup runs right away, to backfill the
+        days Home Assistant was not running.
+
+        Args:
+        ----
+            data: The thermostats by serial number.
+            read_at: When the energy usage of each thermostat was read.
+
+        """
+        if self._importing or "recorder" not in self.hass.config.components:
+            return
+        now = monotonic()
+        if (
+            self._last_import is not None
+            and now - self._last_import < ENERGY_IMPORT_INTERVAL
+        ):
+            return
+        self._last_import = now
+        self._importing = True
+        self.hass.async_create_background_task(
+            self._async_import(dict(data), dict(read_at)),
+            f"{DOMAIN} energy statistics import",
+        )
+
+    async def _async_import(
+        self, data: dict[str, Thermostat], read_at: dict[str, datetime]
+    ) -> None:
+        """Import the days whose usage changed since the last import.
+
+        The first value is the usage of the day the thermostat was read,
+        which differs from the current day when it was read before
+        midnight, so the days count back from then.
+        """
+        try:
+            for idx, thermostat in data.items():
+                if thermostat.energy and (read := read_at.get(idx)) is not None:
+                    today = dt_util.start_of_local_day(dt_util.as_local(read))
+                    await self._async_import_thermostat(idx, thermostat, today)
+        finally:
+            self._importing = False
+
+    async def _async_import_thermostat(
+        self, idx: str, thermostat: Thermostat, today: datetime
+    ) -> None:
+        """Import the energy usage of a single thermostat.
+
+        Args:
+        ----
+            idx: The serial number of the thermostat.
+            thermostat: The thermostat, with the usage of its read day first.
+            today: The start of the day the thermostat was read.
+
+        """
+        energy = thermostat.energy or []
+        days = [
+            (today - timedelta(days=age), usage)
+            for age, usage in reversed(list(enumerate(energy)))
+        ]
+        imported = self._imported.get(idx, {})
+        changed = next(
+            (
+                index
+                for index, (start, usage) in enumerate(days)
+                if imported.get(start.timestamp(), (None,))[0] != usage
+            ),
+            None,
+        )
+        if changed is None:
+            return
+
+        statistic_id = self.statistic_id(idx)
+        if changed:
+            total = imported[days[changed - 1][0].timestamp()][1]
+        else:
+            total = await get_instance(self.hass).async_add_executor_job(
+                _sum_before, self.hass, statistic_id, days[0][0]
+            )
+
+        statistics: list[StatisticData] = []
+        for start, usage in days[changed:]:
+            total += usage
+            statistics.append(StatisticData(start=start, state=usage, sum=total))
+        async_add_external_statistics(
+            self.hass,
+            StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{thermostat.name} Energy Usage",
+                source=DOMAIN,
+                statistic_id=statistic_id,
+                unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            ),
+            statistics,
+        )
+        self.imports += 1
+        _LOGGER.debug("Imported %s days of energy usage of %s", len(statistics), idx)
+
+        oldest = days[0][0].timestamp()
+        self._imported[idx] = {
+            **{start: value for start, value in imported.items() if start >= oldest},
+            **{
+                statistic["start"].timestamp(): (
+                    statistic["state"],
+                    statistic["sum"],
+                )
+                for statistic in statistics
+            },
+        }
+
+
+def _sum_before(hass: HomeAssistant, statistic_id: str, start: datetime) -> float:
+    """Return the sum of the last statistic before a moment.
+
+    Runs in the recorder's executor.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        statistic_id: The statistic to read.
+        start: The moment the sum is needed for.
+
+    Returns:
+    -------
+        The sum, or 0 if nothing was imported before.
+
+    """
+    last = get_last_statistics(
+        hass, 1, statistic_id, convert_units=False, types={"sum"}
+    )
+    rows = last.get(statistic_id, [])
+    if rows and rows[0]["start"] >= start.timestamp():
+        # Days from start on were imported before; only daily rows are
+        # stored, so reading everything before start stays small.
+        rows = statistics_during_period(
+            hass,
+            dt_util.utc_from_timestamp(0),
+            start,
+            {statistic_id},
+            "hour",
+            None,
+            {"sum"},
+        ).get(statistic_id, [])
+    return (rows[-1].get("sum") or 0.0) if rows else 0.0
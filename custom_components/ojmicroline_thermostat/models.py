@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from typing import Any
 
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, MANUFACTURER
 from .coordinator import OJMicrolineDataUpdateCoordinator
 
 
@@ -15,6 +18,9 @@ class OJMicrolineEntity(CoordinatorEntity[OJMicrolineDataUpdateCoordinator], Ent
     """Defines an OJ Microline Entity."""
 
     idx: str
+    # The Thermostat fields the state is derived from, or None if it also
+    # depends on the current time and has to be written on every update.
+    source_fields: frozenset[str] | None = None
 
     def __init__(self, coordinator: OJMicrolineDataUpdateCoordinator, idx: str) -> None:
         """Initialise the entity.
@@ -39,3 +45,79 @@ class OJMicrolineEntity(CoordinatorEntity[OJMicrolineDataUpdateCoordinator], Ent
 
         """
         return {"identifiers": {(DOMAIN, self.idx)}}
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return whether the state is restored and not confirmed by the API yet.
+
+        Returns
+        -------
+            True if the data was restored from storage and is stale, or the
+            thermostat could not be read and shows its last good snapshot.
+
+        """
+        return self.coordinator.stale or self.coordinator.is_stale(self.idx)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the fields it is derived from changed."""
+        if self.idx not in self.coordinator.data:
+            # The thermostat was removed; the entity is removed with its device.
+            return
+        if self.coordinator.last_update_success and not self._has_source_changes():
+            self.coordinator.stats.skipped_writes += 1
+            return
+        self.coordinator.stats.state_writes += 1
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Copy the values of the thermostat into the entity's attributes.
+
+        Called when the entity is created and before each state write, so
+        the properties Home Assistant reads while writing the state do not
+        look up and convert the thermostat's values again.
+        """
+
+    def _has_source_changes(self) -> bool:
+        """Check whether the fields the state is derived from changed.
+
+        Returns
+        -------
+            True if the state has to be written.
+
+        """
+        if self.source_fields is None:
+            return True
+        return self.coordinator.has_changed(self.idx, self.source_fields)
+
+
+class OJMicrolineAccountEntity(Entity):
+    """Defines a diagnostic entity of the account rather than a thermostat.
+
+    These entities belong to a service device named after the config entry.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: OJMicrolineDataUpdateCoordinator, key: str) -> None:
+        """Initialise the entity.
+
+        Args:
+        ----
+            coordinator: The data coordinator of the account.
+            key: The translation key, also used in the unique ID.
+
+        """
+        self.coordinator = coordinator
+        entry = coordinator.entry
+        self._attr_translation_key = key
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer=MANUFACTURER,
+            name=entry.title,
+            entry_type=DeviceEntryType.SERVICE,
+        )
@@ -0,0 +1,124 @@
+"""Spread the polls of all OJ Microline accounts over the poll interval."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SCHEDULER, MAX_CONCURRENT_UPDATES, UPDATE_INTERVAL
+
+if TYPE_CHECKING:
+    from .coordinator import OJMicrolineDataUpdateCoordinator
+
+
+class OJMicrolinePollScheduler:
+    """Give every config entry its own phase within the poll interval.
+
+    With N entries, entry i polls at i/N of its interval after a shared
+    epoch, so polls are spread evenly instead of firing at the same time
+    after a restart. The phase is a fraction of the interval, so it holds
+    when the interval changes. A semaphore limits how many entries poll
+    at the same time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the scheduler.
+
+        Args:
+        ----
+            hass: The HomeAssistant instance.
+
+        """
+        self.hass = hass
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPDATES)
+        self._epoch = hass.loop.time()
+        self._coordinators: dict[str, OJMicrolineDataUpdateCoordinator] = {}
+        # The interval each entry asked for in its last poll, in seconds.
+        self._intervals: dict[str, float] = {}
+
+    @callback
+    def async_register(self, coordinator: OJMicrolineDataUpdateCoordinator) -> None:
+        """Add a coordinator; the phases of all entries are recomputed.
+
+        Args:
+        ----
+            coordinator: The coordinator of a config entry.
+
+        """
+        self._coordinators[coordinator.entry.entry_id] = coordinator
+
+    @callback
+    def async_unregister(self, coordinator: OJMicrolineDataUpdateCoordinator) -> None:
+        """Remove a coordinator; the scheduler is dropped with the last one.
+
+        Args:
+        ----
+            coordinator: The coordinator of a config entry.
+
+        """
+        self._coordinators.pop(coordinator.entry.entry_id, None)
+        self._intervals.pop(coordinator.entry.entry_id, None)
+        if not self._coordinators:
+            self.hass.data.pop(DATA_SCHEDULER, None)
+
+    @property
+    def phase_offsets(self) -> dict[str, float]:
+        """Return the phase of every entry in seconds into its poll interval.
+
+        Returns
+        -------
+            The offset in seconds by config entry ID.
+
+        """
+        return {
+            entry_id: self._phase(entry_id)
+            * self._intervals.get(entry_id, UPDATE_INTERVAL)
+            for entry_id in self._coordinators
+        }
+
+    def _phase(self, entry_id: str) -> float:
+        """Return the phase of an entry as a fraction of its interval."""
+        return list(self._coordinators).index(entry_id) / len(self._coordinators)
+
+    @callback
+    def async_align(self, entry_id: str, interval: timedelta) -> timedelta:
+        """Stretch an interval so the next poll lands on the entry's phase.
+
+        Args:
+        ----
+            entry_id: The ID of the config entry that just polled.
+            interval: The interval the entry wants to poll at.
+
+        Returns:
+        -------
+            A delay between half and one and a half times the interval.
+
+        """
+        seconds = self._intervals[entry_id] = interval.total_seconds()
+        now = self.hass.loop.time()
+        slot = self._epoch + self._phase(entry_id) * seconds
+        delay = (slot - now) % seconds
+        if delay < seconds / 2:
+            delay += seconds
+        return timedelta(seconds=delay)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> OJMicrolinePollScheduler:
+    """Return the scheduler shared by all config entries.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+
+    Returns:
+    -------
+        The scheduler, created on first use.
+
+    """
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = OJMicrolinePollScheduler(hass)
+    return scheduler  # type: ignore[no-any-return]
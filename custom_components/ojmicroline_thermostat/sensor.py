@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable  # pylint: disable=import-error
+from collections.abc import Callable, Collection  # pylint: disable=import-error
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,7 +12,8 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfEnergy, UnitOfTemperature
+from homeassistant.const import UnitOfEnergy, UnitOfTemperature, UnitOfTime
+from homeassistant.core import callback
 
 from ojmicroline_thermostat import Thermostat
 from ojmicroline_thermostat.const import (
@@ -23,8 +24,16 @@ from ojmicroline_thermostat.const import (
     SENSOR_ROOM_FLOOR,
 )
 
-from .const import DOMAIN, MODE_FLOOR, MODE_ROOM, MODE_ROOM_FLOOR
-from .models import OJMicrolineEntity
+from .circuit_breaker import BreakerState
+from .const import (
+    CONF_MODEL,
+    DOMAIN,
+    MODE_FLOOR,
+    MODE_ROOM,
+    MODE_ROOM_FLOOR,
+    MODEL_WD5_SERIES,
+)
+from .models import OJMicrolineAccountEntity, OJMicrolineEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -55,12 +64,20 @@ class OJMicrolineSensorInfo:
     In addition to a SensorEntityDescription for Home Assistant, it may
     include Callables to fetch the raw value (overriding the default behavior
     of using the entity description's key) and to format the raw value.
+    A value getter lists the fields it reads in source_fields, so the
+    sensor is only written when they change.
     """
 
     entity_description: SensorEntityDescription
     formatter: ValueFormatter | None = None
     # Defaults to getattr on the key if None
     value_getter: ValueGetterOverride | None = None
+    # Defaults to the key if there is no value_getter; None means the value
+    # depends on the current time and is written on every update.
+    source_fields: frozenset[str] | None = None
+    # The series whose thermostats support the sensor. If None, the sensor
+    # is created when its value is not None on the first update.
+    models: frozenset[str] | None = None
 
 
 def _get_value(
@@ -147,7 +164,13 @@ SENSOR_TYPES: list[OJMicrolineSensorInfo] = [
             state_class=SensorStateClass.TOTAL_INCREASING,
             key="energy_usage",
         ),
-        value_getter=lambda thermostat: thermostat.get_current_energy(),
+        # WG4 thermostats report no energy usage, as an empty list.
+        value_getter=lambda thermostat: (
+            thermostat.get_current_energy() if thermostat.energy else None
+        ),
+        source_fields=frozenset({"energy"}),
+        # Created even if the first read of the energy usage failed.
+        models=frozenset({MODEL_WD5_SERIES}),
     ),
     OJMicrolineSensorInfo(
         SensorEntityDescription(
@@ -164,6 +187,7 @@ SENSOR_TYPES: list[OJMicrolineSensorInfo] = [
         value_getter=lambda thermostat: thermostat.boost_end_time
         if thermostat.regulation_mode == REGULATION_BOOST
         else None,
+        source_fields=frozenset({"boost_end_time", "regulation_mode"}),
     ),
     OJMicrolineSensorInfo(
         SensorEntityDescription(
@@ -174,6 +198,7 @@ SENSOR_TYPES: list[OJMicrolineSensorInfo] = [
         value_getter=lambda thermostat: thermostat.comfort_end_time
         if thermostat.regulation_mode == REGULATION_COMFORT
         else None,
+        source_fields=frozenset({"comfort_end_time", "regulation_mode"}),
     ),
     OJMicrolineSensorInfo(
         SensorEntityDescription(
@@ -184,6 +209,7 @@ SENSOR_TYPES: list[OJMicrolineSensorInfo] = [
         value_getter=lambda thermostat: thermostat.vacation_begin_time
         if thermostat.vacation_mode
         else None,
+        source_fields=frozenset({"vacation_begin_time", "vacation_mode"}),
     ),
     OJMicrolineSensorInfo(
         SensorEntityDescription(
@@ -194,6 +220,7 @@ SENSOR_TYPES: list[OJMicrolineSensorInfo] = [
         value_getter=lambda thermostat: thermostat.vacation_end_time
         if thermostat.vacation_mode
         else None,
+        source_fields=frozenset({"vacation_end_time", "vacation_mode"}),
     ),
 ]
 
@@ -213,27 +240,49 @@ async def async_setup_entry(
 
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
-
-    for idx in coordinator.data.keys():  # noqa: SIM118
-        for info in SENSOR_TYPES:
-            # Different models of thermostat support different sensors;
-            # skip creating entities if the value is None.
-            val = _get_value(
-                coordinator.data[idx], info.entity_description, info.value_getter
-            )
-            if val is not None:
-                entities.append(
-                    OJMicrolineSensor(
-                        coordinator,
-                        idx,
-                        info.entity_description,
-                        info.formatter,
-                        info.value_getter,
+    model = entry.data[CONF_MODEL]
+
+    @callback
+    def _async_add_sensors(serials: Collection[str]) -> None:
+        entities = []
+        for idx in serials:
+            for info in SENSOR_TYPES:
+                # Different models of thermostat support different sensors;
+                # skip creating entities if the model does not support it or,
+                # if unknown, the value is None.
+                if info.models is not None:
+                    supported = model in info.models
+                else:
+                    supported = (
+                        _get_value(
+                            coordinator.data[idx],
+                            info.entity_description,
+                            info.value_getter,
+                        )
+                        is not None
                     )
-                )
+                if supported:
+                    entities.append(
+                        OJMicrolineSensor(
+                            coordinator,
+                            idx,
+                            info.entity_description,
+                            info.formatter,
+                            info.value_getter,
+                            source_fields=info.source_fields,
+                        )
+                    )
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            OJMicrolineApiStatusSensor(coordinator),
+            OJMicrolineCommandLatencySensor(coordinator),
+            OJMicrolineRequestLatencySensor(coordinator),
+            OJMicrolineFailedRequestsSensor(coordinator),
+        ]
+    )
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_sensors))
 
 
 class OJMicrolineSensor(OJMicrolineEntity, SensorEntity):
@@ -243,13 +292,15 @@ class OJMicrolineSensor(OJMicrolineEntity, SensorEntity):
     formatter: ValueFormatter | None
     value_getter: ValueGetterOverride | None
 
-    def __init__(  # pylint: disable=too-many-arguments
+    def __init__(  # pylint: disable=too-many-arguments  # noqa: PLR0913
         self,
         coordinator: OJMicrolineDataUpdateCoordinator,
         idx: str,
         entity_description: SensorEntityDescription,
         formatter: ValueFormatter | None,
         value_getter: ValueGetterOverride | None,
+        *,
+        source_fields: frozenset[str] | None = None,
     ) -> None:
         """Initialise the entity.
 
@@ -258,6 +309,7 @@ class OJMicrolineSensor(OJMicrolineEntity, SensorEntity):
             coordinator: The data coordinator updating the models.
             idx: The identifier for this entity.
             key: The key to get the sensor info from BINARY_SENSOR_TYPES.
+            source_fields: The fields read by the value_getter.
 
         """
         super().__init__(coordinator, idx)
@@ -265,9 +317,22 @@ class OJMicrolineSensor(OJMicrolineEntity, SensorEntity):
         self.entity_description = entity_description
         self.formatter = formatter
         self.value_getter = value_getter
+        if value_getter is None:
+            source_fields = frozenset({entity_description.key})
+        if source_fields is not None:
+            # The availability follows the online field.
+            source_fields |= {"online"}
+        self.source_fields = source_fields
+        if (
+            entity_description.key == "energy_usage"
+            and coordinator.energy_statistics is not None
+        ):
+            # The daily usage is imported as external statistics instead.
+            self._attr_state_class = None
 
         self._attr_unique_id = f"{idx}_{self.entity_description.key}"
         self._attr_name = f"{coordinator.data[idx].name} {self.entity_description.name}"
+        self._async_update_attrs()
 
     @property
     def available(self) -> bool:
@@ -278,19 +343,189 @@ class OJMicrolineSensor(OJMicrolineEntity, SensorEntity):
             True if the sensor is available, false otherwise.
 
         """
-        return self.coordinator.data[self.idx].online
+        return self._attr_available
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Store the state and availability of the sensor."""
+        thermostat = self.coordinator.data[self.idx]
+        val = _get_value(thermostat, self.entity_description, self.value_getter)
+        if self.formatter is not None:
+            val = self.formatter(val)
+        self._attr_native_value = val
+        self._attr_available = thermostat.online
+
+
+class OJMicrolineApiStatusSensor(OJMicrolineAccountEntity, SensorEntity):
+    """Shows the state of the circuit breaker guarding the account's API calls."""
+
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options: ClassVar[list[str]] = [state.value for state in BreakerState]
+
+    def __init__(self, coordinator: OJMicrolineDataUpdateCoordinator) -> None:
+        """Initialise the entity.
+
+        Args:
+        ----
+            coordinator: The data coordinator of the account.
+
+        """
+        super().__init__(coordinator, "api_status")
+        self.breaker = coordinator.breaker
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state whenever the breaker changes."""
+        self.async_on_remove(self.breaker.async_add_listener(self.async_write_ha_state))
 
     @property
-    def native_value(self) -> Any | None:
-        """Return the state of the sensor.
+    def native_value(self) -> str:
+        """Return the state of the circuit breaker.
 
         Returns
         -------
-            The current state value of the sensor.
+            closed, open or half_open.
 
         """
-        thermostat = self.coordinator.data[self.idx]
-        val = _get_value(thermostat, self.entity_description, self.value_getter)
-        if self.formatter is not None:
-            return self.formatter(val)
-        return val
+        return self.breaker.state.value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of failures and when the API is tried again.
+
+        Returns
+        -------
+            The consecutive failures and the retry time, if open.
+
+        """
+        return {
+            "consecutive_failures": self.breaker.failures,
+            "retry_at": self.breaker.retry_at,
+        }
+
+
+class OJMicrolineRequestLatencySensor(OJMicrolineAccountEntity, SensorEntity):
+    """Shows the 95th percentile latency of the requests to the API.
+
+    The statistics come from the HTTP session, which is shared by all
+    accounts on the same host. Disabled by default.
+    """
+
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator: OJMicrolineDataUpdateCoordinator) -> None:
+        """Initialise the entity.
+
+        Args:
+        ----
+            coordinator: The data coordinator of the account.
+
+        """
+        super().__init__(coordinator, "request_latency")
+
+    async def async_update(self) -> None:
+        """Read the latency histograms."""
+        tracer = self.coordinator.tracer
+        self._attr_native_value = _to_milliseconds(
+            tracer.totals().latency.quantile(0.95)
+        )
+        self._attr_extra_state_attributes = {
+            path: {
+                "requests": stats.latency.count,
+                "p50": _to_milliseconds(stats.latency.quantile(0.5)),
+                "p95": _to_milliseconds(stats.latency.quantile(0.95)),
+                "time_to_first_byte_p95": _to_milliseconds(
+                    stats.time_to_first_byte.quantile(0.95)
+                ),
+            }
+            for path, stats in tracer.endpoints.items()
+        }
+
+
+class OJMicrolineFailedRequestsSensor(OJMicrolineAccountEntity, SensorEntity):
+    """Counts the requests to the API that failed. Disabled by default."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator: OJMicrolineDataUpdateCoordinator) -> None:
+        """Initialise the entity.
+
+        Args:
+        ----
+            coordinator: The data coordinator of the account.
+
+        """
+        super().__init__(coordinator, "failed_requests")
+
+    async def async_update(self) -> None:
+        """Count the failed requests."""
+        totals = self.coordinator.tracer.totals()
+        self._attr_native_value = totals.failures
+        self._attr_extra_state_attributes = {
+            "statuses": totals.statuses,
+            "exceptions": totals.exceptions,
+        }
+
+
+class OJMicrolineCommandLatencySensor(OJMicrolineAccountEntity, SensorEntity):
+    """Shows how long writes take until a refresh reports the new values.
+
+    The state is the 95th percentile of the recent writes; the other
+    percentiles and the time until the API accepted a write are attributes.
+    """
+
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator: OJMicrolineDataUpdateCoordinator) -> None:
+        """Initialise the entity.
+
+        Args:
+        ----
+            coordinator: The data coordinator of the account.
+
+        """
+        super().__init__(coordinator, "command_latency")
+        self.tracker = coordinator.command_latency
+        self._async_update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state whenever a write was measured."""
+        self.async_on_remove(self.tracker.async_add_listener(self._handle_update))
+
+    @callback
+    def _handle_update(self) -> None:
+        """Store and write the new percentiles."""
+        self._async_update_attrs()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Store the percentiles of the tracker."""
+        stats = self.tracker.as_dict()
+        confirmed = stats["confirmed"]
+        acknowledged = stats["acknowledged"]
+        self._attr_native_value = confirmed["p95"]
+        self._attr_extra_state_attributes = {
+            "confirmed_p50": confirmed["p50"],
+            "confirmed_p99": confirmed["p99"],
+            "acknowledged_p50": acknowledged["p50"],
+            "acknowledged_p95": acknowledged["p95"],
+            "acknowledged_p99": acknowledged["p99"],
+            "samples": confirmed["samples"],
+            "failed": stats["failed"],
+            "rolled_back": stats["rolled_back"],
+        }
+
+
+def _to_milliseconds(seconds: float | None) -> float | None:
+    """Convert a duration in seconds to milliseconds."""
+    return None if seconds is None else seconds * 1000
@@ -0,0 +1,334 @@
+"""Services changing many OJ Microline thermostats at once."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable  # pylint: disable=import-error
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.components.climate import ATTR_PRESET_MODE, ClimateEntity
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE, ENTITY_MATCH_ALL
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from ojmicroline_thermostat import OJMicrolineError
+from ojmicroline_thermostat.const import REGULATION_COMFORT, REGULATION_MANUAL
+
+from .climate import HA_TO_VENDOR_STATE, VENDOR_TO_HA_STATE, OJMicrolineThermostat
+from .const import (
+    ATTR_DURATION,
+    ATTR_MAX_CONCURRENCY,
+    BULK_MAX_CONCURRENCY,
+    CONF_COMFORT_MODE_DURATION,
+    CONF_MODEL,
+    CONF_USE_COMFORT_MODE,
+    DOMAIN,
+    MODEL_WD5_SERIES,
+    SERVICE_BULK_SET_PRESET_MODE,
+    SERVICE_BULK_SET_TEMPERATURE,
+    WRITE_CONFIRM_DELAYS,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity_component import EntityComponent
+
+    from ojmicroline_thermostat import Thermostat
+
+    from .coordinator import OJMicrolineDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Returns the regulation mode, temperature and comfort duration to write
+# to a thermostat of a coordinator.
+RegulationGetter = Callable[
+    ["OJMicrolineDataUpdateCoordinator", "Thermostat"],
+    tuple[int, int | None, int | None],
+]
+
+_CONCURRENCY = vol.All(vol.Coerce(int), vol.Range(min=1, max=50))
+
+BULK_SET_PRESET_MODE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_PRESET_MODE): vol.In(list(HA_TO_VENDOR_STATE)),
+        vol.Optional(ATTR_MAX_CONCURRENCY, default=BULK_MAX_CONCURRENCY): _CONCURRENCY,
+    }
+)
+BULK_SET_TEMPERATURE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_TEMPERATURE): vol.Coerce(float),
+        vol.Optional(ATTR_DURATION): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_MAX_CONCURRENCY, default=BULK_MAX_CONCURRENCY): _CONCURRENCY,
+    }
+)
+
+
+@dataclass
+class _Write:
+    """A single set_regulation_mode call covering one or more thermostats."""
+
+    coordinator: OJMicrolineDataUpdateCoordinator
+    idx: str
+    regulation_mode: int
+    temperature: int | None = None
+    duration: int | None = None
+    # The climate entities the write applies to.
+    entities: list[OJMicrolineThermostat] = field(default_factory=list)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the bulk services.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+
+    """
+
+    async def _async_bulk_set_preset_mode(call: ServiceCall) -> ServiceResponse:
+        regulation_mode = HA_TO_VENDOR_STATE[call.data[ATTR_PRESET_MODE]]
+        return await _async_bulk_write(
+            hass, call, lambda _coordinator, _thermostat: (regulation_mode, None, None)
+        )
+
+    async def _async_bulk_set_temperature(call: ServiceCall) -> ServiceResponse:
+        temperature = int(call.data[ATTR_TEMPERATURE] * 100)
+
+        def _regulation(
+            coordinator: OJMicrolineDataUpdateCoordinator, thermostat: Thermostat
+        ) -> tuple[int, int | None, int | None]:
+            # Like the climate entity, unless a duration asks for comfort mode.
+            options = coordinator.entry.options
+            if ATTR_DURATION in call.data:
+                return REGULATION_COMFORT, temperature, call.data[ATTR_DURATION]
+            if thermostat.regulation_mode in {REGULATION_MANUAL, REGULATION_COMFORT}:
+                mode = thermostat.regulation_mode
+            elif options.get(CONF_USE_COMFORT_MODE):
+                mode = REGULATION_COMFORT
+            else:
+                mode = REGULATION_MANUAL
+            return mode, temperature, options.get(CONF_COMFORT_MODE_DURATION)
+
+        return await _async_bulk_write(hass, call, _regulation)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_SET_PRESET_MODE,
+        _async_bulk_set_preset_mode,
+        schema=BULK_SET_PRESET_MODE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_SET_TEMPERATURE,
+        _async_bulk_set_temperature,
+        schema=BULK_SET_TEMPERATURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_bulk_write(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    regulation: RegulationGetter,
+) -> ServiceResponse:
+    """Send the writes of a bulk service call through the command queues.
+
+    WD5 thermostats are written per zone by the API, so a zone gets a
+    single write however many of its thermostats were targeted. Every
+    targeted entity shows the new values right away and confirms or rolls
+    them back like a write of its own. The command queues send at most
+    max_concurrency writes at a time, so the writes are acknowledged one
+    after another; a single refresh per account, after the last write was
+    sent, confirms them all.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        call: The service call.
+        regulation: Returns what to write to each thermostat.
+
+    Returns:
+    -------
+        The outcome per climate entity, if a response was requested.
+
+    Raises:
+    ------
+        ServiceValidationError: No write was sent, because no OJ Microline
+            thermostat was targeted or none supports the preset.
+        HomeAssistantError: All writes failed.
+
+    """
+    writes: dict[tuple[str, Any], _Write] = {}
+    results: dict[str, dict[str, Any]] = {}
+    for entity in _async_resolve_thermostats(hass, call):
+        coordinator = entity.coordinator
+        thermostat = coordinator.data[entity.idx]
+        regulation_mode, temperature, duration = regulation(coordinator, thermostat)
+        if regulation_mode not in thermostat.supported_regulation_modes:
+            results[entity.entity_id] = {
+                "success": False,
+                "error": "Preset not supported by this thermostat",
+            }
+            continue
+        key = (
+            coordinator.entry.entry_id,
+            thermostat.zone_id
+            if coordinator.entry.data[CONF_MODEL] == MODEL_WD5_SERIES
+            else entity.idx,
+        )
+        write = writes.setdefault(
+            key,
+            _Write(coordinator, entity.idx, regulation_mode, temperature, duration),
+        )
+        write.entities.append(entity)
+
+    if not writes:
+        msg = (
+            "None of the targeted thermostats support this preset"
+            if results
+            else "No OJ Microline thermostats were targeted"
+        )
+        raise ServiceValidationError(msg)
+
+    semaphore = asyncio.Semaphore(call.data[ATTR_MAX_CONCURRENCY])
+    refreshes: dict[OJMicrolineDataUpdateCoordinator, asyncio.Future[None]] = {
+        write.coordinator: hass.loop.create_future() for write in writes.values()
+    }
+
+    async def _async_send(write: _Write) -> str | None:
+        # One queued command, awaited by every entity it applies to.
+        sent = asyncio.ensure_future(
+            write.coordinator.commands.async_set_regulation_mode(
+                write.idx,
+                write.regulation_mode,
+                write.temperature,
+                write.duration,
+                semaphore=semaphore,
+            )
+        )
+        pending: dict[str, Any] = {
+            "preset_mode": VENDOR_TO_HA_STATE[write.regulation_mode]
+        }
+        if write.temperature is not None:
+            pending["target_temperature"] = write.temperature / 100
+        errors = await asyncio.gather(
+            *(
+                entity.async_write_pending(
+                    sent, refreshed=refreshes[write.coordinator], **pending
+                )
+                for entity in write.entities
+            ),
+            return_exceptions=True,
+        )
+        error = next((error for error in errors if error is not None), None)
+        if error is None:
+            return None
+        if not isinstance(error, OJMicrolineError):
+            raise error
+        return str(error) or type(error).__name__
+
+    errors = await asyncio.gather(*(_async_send(write) for write in writes.values()))
+    sent: set[OJMicrolineDataUpdateCoordinator] = set()
+    for write, error in zip(writes.values(), errors, strict=True):
+        entity_ids = [entity.entity_id for entity in write.entities]
+        if error is not None:
+            _LOGGER.warning("Bulk write to %s failed: %s", ", ".join(entity_ids), error)
+        else:
+            sent.add(write.coordinator)
+        for entity_id in entity_ids:
+            results[entity_id] = {"success": error is None, "error": error}
+
+    for coordinator, refreshed in refreshes.items():
+        if coordinator in sent:
+            hass.async_create_background_task(
+                _async_confirm_writes(coordinator, refreshed),
+                f"{DOMAIN} confirm bulk write {coordinator.entry.title}",
+            )
+        else:
+            refreshed.set_result(None)
+
+    if all(error is not None for error in errors):
+        msg = f"All {len(writes)} writes failed, e.g.: {errors[0]}"
+        raise HomeAssistantError(msg)
+
+    if not call.return_response:
+        return None
+    return {"results": results}
+
+
+async def _async_confirm_writes(
+    coordinator: OJMicrolineDataUpdateCoordinator, refreshed: asyncio.Future[None]
+) -> None:
+    """Refresh once for all writes of a bulk call to an account.
+
+    Args:
+    ----
+        coordinator: The coordinator of the account.
+        refreshed: Resolved once the refresh completed, or failed.
+
+    """
+    try:
+        await asyncio.sleep(WRITE_CONFIRM_DELAYS[0])
+        await coordinator.async_confirm_refresh()
+    finally:
+        refreshed.set_result(None)
+
+
+def _async_resolve_thermostats(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[OJMicrolineThermostat]:
+    """Find the thermostats targeted by entities, devices, areas or all.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        call: The service call.
+
+    Returns:
+    -------
+        The climate entity of each targeted thermostat that is loaded.
+
+    """
+    registry = er.async_get(hass)
+    coordinators: dict[str, OJMicrolineDataUpdateCoordinator] = hass.data.get(
+        DOMAIN, {}
+    )
+    if call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL:
+        entity_ids = {
+            entry.entity_id
+            for entry_id in coordinators
+            for entry in er.async_entries_for_config_entry(registry, entry_id)
+        }
+    else:
+        selected = async_extract_referenced_entity_ids(hass, call)
+        entity_ids = selected.referenced | selected.indirectly_referenced
+    component: EntityComponent[ClimateEntity] | None = hass.data.get(CLIMATE_DOMAIN)
+    thermostats = []
+    for entity_id in sorted(entity_ids):
+        entry = registry.async_get(entity_id)
+        if (
+            component is None
+            or entry is None
+            or entry.platform != DOMAIN
+            or entry.domain != CLIMATE_DOMAIN
+            or (coordinator := coordinators.get(entry.config_entry_id or "")) is None
+            or entry.unique_id not in coordinator.data
+            or not isinstance(
+                entity := component.get_entity(entity_id), OJMicrolineThermostat
+            )
+        ):
+            continue
+        thermostats.append(entity)
+    return thermostats
@@ -0,0 +1,132 @@
+"""Persist the last known thermostats so entities can be restored on startup."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import fields
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from ojmicroline_thermostat import Thermostat
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+_FIELDS = [field.name for field in fields(Thermostat)]
+_DATETIME_FIELDS = {
+    "boost_end_time",
+    "comfort_end_time",
+    "vacation_begin_time",
+    "vacation_end_time",
+}
+
+
+class OJMicrolineSnapshotStore:
+    """Store the thermostats of a config entry in Home Assistant's storage.
+
+    The thermostats are stored as rows of values with a single shared list
+    of field names, which keeps the file small for large accounts.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialise the store.
+
+        Args:
+        ----
+            hass: The HomeAssistant instance.
+            entry_id: The ID of the config entry the thermostats belong to.
+
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+
+    async def async_load(self) -> dict[str, Thermostat] | None:
+        """Load the stored thermostats.
+
+        Returns
+        -------
+            The thermostats by serial number, or None if nothing usable
+            was stored.
+
+        """
+        if (data := await self._store.async_load()) is None:
+            return None
+        try:
+            return _decode(data)
+        except (KeyError, TypeError, ValueError) as error:
+            _LOGGER.warning("Ignoring unusable thermostat snapshot: %s", error)
+            return None
+
+    @callback
+    def async_save(self, thermostats: dict[str, Thermostat]) -> None:
+        """Save the thermostats after a short delay.
+
+        Args:
+        ----
+            thermostats: The thermostats by serial number.
+
+        """
+        self._store.async_delay_save(lambda: _encode(thermostats), SNAPSHOT_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the stored thermostats."""
+        await self._store.async_remove()
+
+
+def _encode(thermostats: dict[str, Thermostat]) -> dict[str, Any]:
+    """Encode thermostats as rows of values.
+
+    Args:
+    ----
+        thermostats: The thermostats by serial number.
+
+    Returns:
+    -------
+        A JSON serializable dict.
+
+    """
+    rows = []
+    for thermostat in thermostats.values():
+        row = []
+        for name in _FIELDS:
+            value = getattr(thermostat, name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            row.append(value)
+        rows.append(row)
+    return {"fields": _FIELDS, "thermostats": rows}
+
+
+def _decode(data: dict[str, Any]) -> dict[str, Thermostat]:
+    """Decode thermostats stored by _encode.
+
+    Fields that are no longer known are dropped; a missing required field
+    raises a TypeError.
+
+    Args:
+    ----
+        data: The stored dict.
+
+    Returns:
+    -------
+        The thermostats by serial number.
+
+    """
+    names = data["fields"]
+    thermostats = {}
+    for row in data["thermostats"]:
+        values: dict[str, Any] = {
+            name: datetime.fromisoformat(value)
+            if name in _DATETIME_FIELDS and value is not None
+            else value
+            for name, value in zip(names, row, strict=True)
+            if name in _FIELDS
+        }
+        thermostat = Thermostat(**values)
+        thermostats[thermostat.serial_number] = thermostat
+    return thermostats
@@ -0,0 +1,193 @@
+"""Append the polled values of the thermostats to local CSV files."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    TELEMETRY_BATCH_ROWS,
+    TELEMETRY_FLUSH_INTERVAL,
+    TELEMETRY_MAX_FILE_SIZE,
+    TELEMETRY_ROTATE_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from ojmicroline_thermostat import Thermostat
+
+_LOGGER = logging.getLogger(__name__)
+
+# Temperatures are in hundredths of a degree and energy in kWh, like the API.
+TELEMETRY_COLUMNS = (
+    "timestamp",
+    "serial_number",
+    "online",
+    "heating",
+    "regulation_mode",
+    "current_temperature",
+    "target_temperature",
+    "energy_today",
+)
+
+
+class OJMicrolineTelemetry:
+    """Write a row per thermostat and update to rotating CSV files.
+
+    Rows are buffered on the event loop, which only copies a few values
+    per thermostat, and written by the executor every
+    TELEMETRY_FLUSH_INTERVAL seconds or once TELEMETRY_BATCH_ROWS are
+    buffered. A new file is started when the current one reaches
+    TELEMETRY_MAX_FILE_SIZE bytes or is TELEMETRY_ROTATE_INTERVAL seconds
+    old; files are never rewritten.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialise the writer.
+
+        Args:
+        ----
+            hass: The HomeAssistant instance.
+            entry_id: The ID of the config entry, which names the directory.
+
+        """
+        self.hass = hass
+        self.directory = Path(hass.config.path(f"{DOMAIN}_telemetry", entry_id))
+        self.rows_written = 0
+        # Rows lost because writing them failed.
+        self.rows_failed = 0
+        self._rows: list[tuple[Any, ...]] = []
+        # Batches are written one at a time, in the order they were taken.
+        self._lock = asyncio.Lock()
+        self._file: Path | None = None
+        self._file_started = 0.0
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._flush_job = HassJob(self._async_flush, f"{DOMAIN} telemetry")
+        self._unsub_final_write: CALLBACK_TYPE | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
+
+    @callback
+    def async_record(self, data: dict[str, Thermostat]) -> None:
+        """Buffer the values of an update.
+
+        Args:
+        ----
+            data: The thermostats by serial number.
+
+        """
+        timestamp = int(time.time())
+        self._rows.extend(
+            (
+                timestamp,
+                idx,
+                int(thermostat.online),
+                int(thermostat.heating),
+                thermostat.regulation_mode,
+                thermostat.get_current_temperature(),
+                thermostat.get_target_temperature(),
+                thermostat.energy[0] if thermostat.energy else None,
+            )
+            for idx, thermostat in data.items()
+        )
+        if len(self._rows) >= TELEMETRY_BATCH_ROWS:
+            self._async_flush()
+        elif self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, TELEMETRY_FLUSH_INTERVAL, self._flush_job
+            )
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of rows waiting to be written.
+
+        Returns
+        -------
+            The number of buffered rows.
+
+        """
+        return len(self._rows)
+
+    async def async_stop(self) -> None:
+        """Write the buffered rows and stop listening for the final write."""
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        await self._async_write_buffered()
+
+    async def _async_final_write(self, _event: Event) -> None:
+        """Write the buffered rows before Home Assistant stops."""
+        self._unsub_final_write = None
+        await self._async_write_buffered()
+
+    @callback
+    def _async_flush(self, _now: datetime | None = None) -> None:
+        """Write the buffered rows in the background."""
+        if self._rows:
+            self.hass.async_create_background_task(
+                self._async_write_buffered(), f"{DOMAIN} telemetry write"
+            )
+
+    async def _async_write_buffered(self) -> None:
+        """Take the buffered rows and write them in the executor."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        rows, self._rows = self._rows, []
+        if not rows:
+            return
+        async with self._lock:
+            try:
+                await self.hass.async_add_executor_job(self._write, rows)
+            except OSError as error:
+                self.rows_failed += len(rows)
+                _LOGGER.warning(
+                    "Could not write telemetry to %s: %s", self.directory, error
+                )
+                return
+        self.rows_written += len(rows)
+
+    def _write(self, rows: list[tuple[Any, ...]]) -> None:
+        """Append rows to the current file, starting a new one if needed.
+
+        Runs in the executor.
+
+        Args:
+        ----
+            rows: The rows to append.
+
+        """
+        now = time.time()
+        if (
+            self._file is None
+            or now - self._file_started >= TELEMETRY_ROTATE_INTERVAL
+            or not self._file.exists()
+            or self._file.stat().st_size >= TELEMETRY_MAX_FILE_SIZE
+        ):
+            self.directory.mkdir(parents=True, exist_ok=True)
+            name = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(now))
+            path = self.directory / f"{name}.csv"
+            # Rotating twice within a second must not reopen the old file.
+            sequence = 0
+            while path.exists():
+                sequence += 1
+                path = self.directory / f"{name}-{sequence}.csv"
+            self._file = path
+            self._file_started = now
+            _LOGGER.debug("Writing telemetry to %s", self._file)
+        new = not self._file.exists()
+        with self._file.open("a", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            if new:
+                writer.writerow(TELEMETRY_COLUMNS)
+            writer.writerows(rows)
@@ -0,0 +1,390 @@
+"""Latency statistics of the requests and commands sent to the OJ Microline API."""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import TraceConfig
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import (
+    COMMAND_LATENCY_SAMPLES,
+    MAX_TRACED_ENDPOINTS,
+    REQUEST_LATENCY_BUCKETS,
+)
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from aiohttp import (
+        ClientSession,
+        TraceRequestEndParams,
+        TraceRequestExceptionParams,
+        TraceRequestRedirectParams,
+        TraceRequestStartParams,
+        TraceResponseChunkReceivedParams,
+    )
+    from yarl import URL
+
+# The endpoint that requests are counted under once MAX_TRACED_ENDPOINTS
+# different paths have been seen.
+OTHER_ENDPOINT = "other"
+
+
+@dataclass
+class LatencyHistogram:
+    """Count durations in fixed buckets, so memory does not grow with use."""
+
+    # Upper bounds of the buckets, in seconds; the last bucket is unbounded.
+    bounds: tuple[float, ...] = REQUEST_LATENCY_BUCKETS
+    counts: list[int] = field(init=False)
+    total: float = 0
+
+    def __post_init__(self) -> None:
+        """Create the empty buckets."""
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    @property
+    def count(self) -> int:
+        """Return the number of recorded durations.
+
+        Returns
+        -------
+            The sum of all buckets.
+
+        """
+        return sum(self.counts)
+
+    def record(self, seconds: float) -> None:
+        """Add a duration.
+
+        Args:
+        ----
+            seconds: The duration to add.
+
+        """
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add the durations of a histogram with the same buckets.
+
+        Args:
+        ----
+            other: The histogram to add.
+
+        """
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.total += other.total
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile as the upper bound of the bucket it falls in.
+
+        Args:
+        ----
+            q: The quantile, from 0 to 1.
+
+        Returns:
+        -------
+            The estimate in seconds, the largest bound if it falls in the
+            unbounded bucket, or None if nothing was recorded.
+
+        """
+        if not (count := self.count):
+            return None
+        rank = q * count
+        seen = 0
+        for bound, bucket in zip(self.bounds, self.counts, strict=False):
+            seen += bucket
+            if seen >= rank:
+                return bound
+        return self.bounds[-1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics.
+
+        Returns
+        -------
+            The counts by upper bound, the count and the mean.
+
+        """
+        count = self.count
+        return {
+            "buckets": {
+                **{
+                    f"le_{bound}": n
+                    for bound, n in zip(self.bounds, self.counts, strict=False)
+                },
+                "inf": self.counts[-1],
+            },
+            "count": count,
+            "mean": self.total / count if count else None,
+        }
+
+
+@dataclass
+class EndpointStats:
+    """Statistics of the requests to one endpoint."""
+
+    # Until the whole response body was read.
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # Until the response headers were received.
+    time_to_first_byte: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # Responses by HTTP status code.
+    statuses: dict[int, int] = field(default_factory=dict)
+    # Requests that failed without a response, by exception name.
+    exceptions: dict[str, int] = field(default_factory=dict)
+    redirects: int = 0
+
+    @property
+    def failures(self) -> int:
+        """Return the number of failed requests.
+
+        Returns
+        -------
+            The error responses and the requests without a response.
+
+        """
+        errors = sum(
+            n for status, n in self.statuses.items() if status >= HTTPStatus.BAD_REQUEST
+        )
+        return errors + sum(self.exceptions.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics.
+
+        Returns
+        -------
+            The histograms and counters.
+
+        """
+        return {
+            "latency": self.latency.as_dict(),
+            "time_to_first_byte": self.time_to_first_byte.as_dict(),
+            "statuses": dict(self.statuses),
+            "exceptions": dict(self.exceptions),
+            "redirects": self.redirects,
+        }
+
+
+class OJMicrolineRequestTracer:
+    """Collect EndpointStats of every request made through a session.
+
+    Attach trace_config to the session when creating it. Sessions are
+    shared by all accounts on the same host, so are their statistics.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the tracer."""
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.trace_config = trace_config = TraceConfig()
+        # aiohttp's annotations of the signals do not match their callbacks.
+        trace_config.on_request_start.append(self._on_request_start)  # type: ignore[arg-type]
+        trace_config.on_request_end.append(self._on_request_end)  # type: ignore[arg-type]
+        trace_config.on_response_chunk_received.append(self._on_response_read)  # type: ignore[arg-type]
+        trace_config.on_request_exception.append(self._on_request_exception)  # type: ignore[arg-type]
+        trace_config.on_request_redirect.append(self._on_request_redirect)  # type: ignore[arg-type]
+
+    def totals(self) -> EndpointStats:
+        """Return the statistics of all endpoints together.
+
+        Returns
+        -------
+            The combined statistics.
+
+        """
+        totals = EndpointStats()
+        for stats in self.endpoints.values():
+            totals.latency.merge(stats.latency)
+            totals.time_to_first_byte.merge(stats.time_to_first_byte)
+            for status, n in stats.statuses.items():
+                totals.statuses[status] = totals.statuses.get(status, 0) + n
+            for name, n in stats.exceptions.items():
+                totals.exceptions[name] = totals.exceptions.get(name, 0) + n
+            totals.redirects += stats.redirects
+        return totals
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics.
+
+        Returns
+        -------
+            The statistics by endpoint.
+
+        """
+        return {path: stats.as_dict() for path, stats in self.endpoints.items()}
+
+    def _stats(self, url: URL) -> EndpointStats:
+        """Return the statistics of the endpoint a URL belongs to."""
+        path = url.path.lstrip("/")
+        if path not in self.endpoints and len(self.endpoints) >= MAX_TRACED_ENDPOINTS:
+            path = OTHER_ENDPOINT
+        return self.endpoints.setdefault(path, EndpointStats())
+
+    async def _on_request_start(
+        self,
+        _session: ClientSession,
+        context: SimpleNamespace,
+        _params: TraceRequestStartParams,
+    ) -> None:
+        """Note when the request started."""
+        context.start = monotonic()
+
+    async def _on_request_end(
+        self,
+        _session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        """Record the time to first byte and the status."""
+        elapsed = monotonic() - context.start
+        stats = self._stats(params.url)
+        stats.time_to_first_byte.record(elapsed)
+        status = params.response.status
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        if status >= HTTPStatus.BAD_REQUEST:
+            # The client raises without reading the body of an error.
+            stats.latency.record(elapsed)
+
+    async def _on_response_read(
+        self,
+        _session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceResponseChunkReceivedParams,
+    ) -> None:
+        """Record the latency once the body was read."""
+        self._stats(params.url).latency.record(monotonic() - context.start)
+
+    async def _on_request_exception(
+        self,
+        _session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestExceptionParams,
+    ) -> None:
+        """Record a request that failed without a response."""
+        stats = self._stats(params.url)
+        stats.latency.record(monotonic() - context.start)
+        name = type(params.exception).__name__
+        stats.exceptions[name] = stats.exceptions.get(name, 0) + 1
+
+    async def _on_request_redirect(
+        self,
+        _session: ClientSession,
+        _context: SimpleNamespace,
+        params: TraceRequestRedirectParams,
+    ) -> None:
+        """Count a redirect."""
+        self._stats(params.url).redirects += 1
+
+
+class CommandLatencyTracker:
+    """Measure how long writes take to be acknowledged and confirmed.
+
+    A write is acknowledged when the API accepted it, and confirmed when
+    a refresh reports the written values. Both are measured from the
+    moment the write was submitted, including the command queue's debounce,
+    over the most recent COMMAND_LATENCY_SAMPLES writes.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the tracker."""
+        self.acknowledged: deque[float] = deque(maxlen=COMMAND_LATENCY_SAMPLES)
+        self.confirmed: deque[float] = deque(maxlen=COMMAND_LATENCY_SAMPLES)
+        # Writes the API refused, and writes that were never confirmed.
+        self.failed = 0
+        self.rolled_back = 0
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call a function whenever a write was measured.
+
+        Args:
+        ----
+            update_callback: The function to call.
+
+        Returns:
+        -------
+            A function that removes the listener.
+
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify(self) -> None:
+        """Call all listeners."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_record_acknowledged(self, seconds: float) -> None:
+        """Add the time until the API accepted a write.
+
+        Args:
+        ----
+            seconds: Seconds since the write was submitted.
+
+        """
+        self.acknowledged.append(seconds)
+        self._async_notify()
+
+    @callback
+    def async_record_confirmed(self, seconds: float) -> None:
+        """Add the time until a refresh reported the written values.
+
+        Args:
+        ----
+            seconds: Seconds since the write was submitted.
+
+        """
+        self.confirmed.append(seconds)
+        self._async_notify()
+
+    @callback
+    def async_record_failed(self) -> None:
+        """Count a write the API refused."""
+        self.failed += 1
+        self._async_notify()
+
+    @callback
+    def async_record_rolled_back(self) -> None:
+        """Count a write that was never confirmed."""
+        self.rolled_back += 1
+        self._async_notify()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics and the sensor.
+
+        Returns
+        -------
+            The percentiles of both latencies, in seconds, and the counters.
+
+        """
+        return {
+            "acknowledged": _percentiles(self.acknowledged),
+            "confirmed": _percentiles(self.confirmed),
+            "failed": self.failed,
+            "rolled_back": self.rolled_back,
+        }
+
+
+def _percentiles(samples: deque[float]) -> dict[str, Any]:
+    """Return the nearest-rank p50, p95 and p99 of the samples."""
+    ordered = sorted(samples)
+    result: dict[str, Any] = {"samples": len(ordered)}
+    for percentile in (50, 95, 99):
+        rank = math.ceil(percentile / 100 * len(ordered))
+        result[f"p{percentile}"] = ordered[max(rank, 1) - 1] if ordered else None
+    return result
@@ -0,0 +1,265 @@
+"""Websocket commands sending the thermostats of an account as one table."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from ojmicroline_thermostat import Thermostat
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .coordinator import OJMicrolineDataUpdateCoordinator
+
+# Thermostat fields shared by a zone, sent once per zone under "schedules".
+ZONE_FIELDS = {"schedule"}
+COLUMNS = tuple(
+    field.name for field in fields(Thermostat) if field.name not in ZONE_FIELDS
+)
+# Columns computed from the fields, in the units of the API.
+DERIVED_COLUMNS = ("current_temperature", "target_temperature", "stale")
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+
+    """
+    websocket_api.async_register_command(hass, websocket_fleet)
+    websocket_api.async_register_command(hass, websocket_subscribe_fleet)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/fleet",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_fleet(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the thermostats of an account.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        connection: The websocket connection.
+        msg: The command, with the ID of the config entry.
+
+    """
+    if (coordinator := _get_coordinator(hass, connection, msg)) is None:
+        return
+    connection.send_result(msg["id"], _snapshot(coordinator))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/fleet/subscribe",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe_fleet(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the thermostats of an account, then what changed in each update.
+
+    The first event holds the whole table under "snapshot". Later events
+    hold the changed values by serial number under "changed", removed
+    serial numbers under "removed" and changed zone schedules under
+    "schedules". A failed update sends last_update_success as false; the
+    next successful update, or one whose changes are unknown, sends the
+    whole table again. Unloading the config entry ends the subscription
+    with a not_found error.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        connection: The websocket connection.
+        msg: The command, with the ID of the config entry.
+
+    """
+    if (coordinator := _get_coordinator(hass, connection, msg)) is None:
+        return
+
+    # The derived values last sent by serial number; they can change
+    # without any field changing, e.g. a target temperature that follows
+    # the schedule.
+    sent: dict[str, dict[str, Any]] = {}
+    last_update_success = coordinator.last_update_success
+
+    @callback
+    def _async_send_snapshot() -> None:
+        snapshot = _snapshot(coordinator)
+        sent.clear()
+        for idx, thermostat in (coordinator.data or {}).items():
+            sent[idx] = _derived(coordinator, idx, thermostat)
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"snapshot": snapshot})
+        )
+
+    @callback
+    def _async_send_changes() -> None:
+        nonlocal last_update_success
+        if not coordinator.last_update_success:
+            if last_update_success:
+                connection.send_message(
+                    websocket_api.event_message(
+                        msg["id"], {"last_update_success": False}
+                    )
+                )
+            last_update_success = False
+            return
+        if coordinator.changes is None or not last_update_success:
+            last_update_success = True
+            _async_send_snapshot()
+            return
+
+        data = coordinator.data
+        event: dict[str, Any] = {}
+        changed: dict[str, dict[str, Any]] = {}
+        schedules: dict[str, Any] = {}
+        for idx, thermostat in data.items():
+            values = {
+                name: getattr(thermostat, name)
+                for name in coordinator.changes.get(idx, ())
+                if name not in ZONE_FIELDS
+            }
+            derived = _derived(coordinator, idx, thermostat)
+            previous = sent.get(idx, {})
+            values.update(
+                (name, value)
+                for name, value in derived.items()
+                if previous.get(name) != value
+            )
+            sent[idx] = derived
+            if values:
+                changed[idx] = values
+            if "schedule" in coordinator.changes.get(idx, ()):
+                schedules[str(thermostat.zone_id)] = thermostat.schedule
+        if changed:
+            event["changed"] = changed
+        if removed := sorted(coordinator.removed):
+            event["removed"] = removed
+            for idx in removed:
+                sent.pop(idx, None)
+        if schedules:
+            event["schedules"] = schedules
+        if event:
+            connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    _async_subscribe(connection, msg, coordinator, _async_send_changes)
+    connection.send_result(msg["id"])
+    _async_send_snapshot()
+
+
+@callback
+def _async_subscribe(
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    coordinator: OJMicrolineDataUpdateCoordinator,
+    listener: Callable[[], None],
+) -> None:
+    """Listen to a coordinator until the connection or the entry goes away.
+
+    A listener would outlive an unloaded coordinator, which no longer
+    updates, so unloading the entry also ends the subscription.
+    """
+    remove_listener: Callable[[], None] | None = coordinator.async_add_listener(
+        listener
+    )
+
+    @callback
+    def _async_unsubscribe() -> None:
+        nonlocal remove_listener
+        if remove_listener is not None:
+            remove_listener()
+            remove_listener = None
+
+    @callback
+    def _async_unloaded() -> None:
+        if remove_listener is None:
+            return
+        _async_unsubscribe()
+        connection.subscriptions.pop(msg["id"], None)
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry unloaded"
+        )
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    coordinator.entry.async_on_unload(_async_unloaded)
+
+
+@callback
+def _get_coordinator(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> OJMicrolineDataUpdateCoordinator | None:
+    """Return the coordinator of a loaded entry, or send an error."""
+    coordinator: OJMicrolineDataUpdateCoordinator | None = hass.data.get(
+        DOMAIN, {}
+    ).get(msg["entry_id"])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not loaded"
+        )
+    return coordinator
+
+
+def _snapshot(coordinator: OJMicrolineDataUpdateCoordinator) -> dict[str, Any]:
+    """Return all thermostats of an account as columns.
+
+    Args:
+    ----
+        coordinator: The coordinator of the account.
+
+    Returns:
+    -------
+        The serial numbers, the values of each column in the same order,
+        the schedules by zone ID and whether the last update succeeded.
+
+    """
+    data = coordinator.data or {}
+    columns: dict[str, list[Any]] = {name: [] for name in (*COLUMNS, *DERIVED_COLUMNS)}
+    schedules: dict[str, Any] = {}
+    for idx, thermostat in data.items():
+        for name in COLUMNS:
+            columns[name].append(getattr(thermostat, name))
+        for name, value in _derived(coordinator, idx, thermostat).items():
+            columns[name].append(value)
+        if thermostat.schedule is not None:
+            schedules.setdefault(str(thermostat.zone_id), thermostat.schedule)
+    return {
+        "serial_numbers": list(data),
+        "columns": columns,
+        "schedules": schedules,
+        "last_update_success": coordinator.last_update_success,
+    }
+
+
+def _derived(
+    coordinator: OJMicrolineDataUpdateCoordinator, idx: str, thermostat: Thermostat
+) -> dict[str, Any]:
+    """Return the derived columns of a thermostat."""
+    return {
+        "current_temperature": thermostat.get_current_temperature(),
+        "target_temperature": thermostat.get_target_temperature(),
+        "stale": coordinator.stale or coordinator.is_stale(idx),
+    }
@@ -0,0 +1 @@
+"""Development tools for the OJ Microline Thermostat integration."""
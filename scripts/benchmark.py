@@ -0,0 +1,388 @@
+"""Benchmark the integration against synthetic fleets of thermostats.
+
+Loads the integration into a bare Home Assistant instance, backed by a
+client that answers from a SyntheticFleet instead of the cloud, and
+measures per fleet size:
+
+- setup time of the config entry, including the first refresh,
+- _async_update_data latency,
+- state writes per update,
+- CPU and wall time per poll, including the entity updates,
+- CPU time per update in which every entity writes its state, and in
+  which every entity skips its write, without polling,
+- CPU time to read the state properties of every entity,
+- traced memory per entity after setup.
+
+The results are written as JSON, so they can be compared across releases.
+
+Usage, from the repository root with Home Assistant installed:
+
+    python -m scripts.benchmark --model wd5 --sizes 10,100,1000 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+from homeassistant import config_entries, loader
+from homeassistant.const import __version__ as HA_VERSION  # noqa: N812
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry,
+    device_registry,
+    entity_platform,
+    entity_registry,
+    issue_registry,
+)
+
+from custom_components.ojmicroline_thermostat.api import (
+    _acquire_session,
+    _api_from_config_entry_data,
+)
+from custom_components.ojmicroline_thermostat.client import OJMicrolineClient
+from custom_components.ojmicroline_thermostat.const import (
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_MODEL,
+    CONFIG_FLOW_VERSION,
+    DOMAIN,
+    MODEL_WD5_SERIES,
+    MODEL_WG4_SERIES,
+)
+
+from .synthetic import SyntheticFleet
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from aiohttp import ClientSession
+
+    from custom_components.ojmicroline_thermostat.coordinator import (
+        OJMicrolineDataUpdateCoordinator,
+    )
+
+MODELS = {"wd5": MODEL_WD5_SERIES, "wg4": MODEL_WG4_SERIES}
+INTEGRATION = Path(__file__).parent.parent / "custom_components" / DOMAIN
+# Keep scheduled polls out of the measurements.
+NO_POLLING = 24 * 3600
+
+
+class SyntheticClient(OJMicrolineClient):
+    """Client answering from a synthetic fleet instead of the cloud.
+
+    Responses go through a JSON round trip, so parsing costs the same as
+    with a real response body.
+    """
+
+    def __init__(self, api: Any, session: ClientSession, fleet: SyntheticFleet) -> None:
+        """Initialise the client.
+
+        Args:
+        ----
+            api: The API object of the fleet's model.
+            session: The HTTP session, only used for cleanup.
+            fleet: The fleet to answer from.
+
+        """
+        super().__init__(api=api, session=session)
+        self.fleet = fleet
+
+    async def _request(self, uri: str, **kwargs: Any) -> Any:
+        """Answer a request from the fleet; the method is not needed."""
+        answer = self.fleet.handle(uri, kwargs.get("params"), kwargs.get("body"))
+        return json.loads(json.dumps(answer))
+
+
+async def _async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start a bare Home Assistant instance with the integration available.
+
+    Args:
+    ----
+        config_dir: An empty directory to use as configuration directory.
+
+    Returns:
+    -------
+        The running instance.
+
+    """
+    components = Path(config_dir) / "custom_components"
+    components.mkdir()
+    (components / DOMAIN).symlink_to(INTEGRATION)
+
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    hass.data["entity_info"] = {}
+    if hasattr(loader, "async_setup"):
+        loader.async_setup(hass)
+    await asyncio.gather(
+        area_registry.async_load(hass),
+        device_registry.async_load(hass),
+        entity_registry.async_load(hass),
+        issue_registry.async_load(hass),
+    )
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await hass.async_start()
+    return hass
+
+
+async def _async_with_entry(
+    fleet: SyntheticFleet,
+    run: Callable[[HomeAssistant, config_entries.ConfigEntry], Awaitable[None]],
+) -> None:
+    """Run a measurement on a fresh instance with the fleet's entry.
+
+    Args:
+    ----
+        fleet: The fleet the config entry talks to.
+        run: The measurement, called before the entry is added.
+
+    """
+    entry = config_entries.ConfigEntry(
+        version=CONFIG_FLOW_VERSION,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"Synthetic {fleet.size}",
+        data={
+            CONF_MODEL: fleet.model,
+            "username": "benchmark",
+            "password": "benchmark",
+            "api_key": "benchmark",
+        },
+        source=config_entries.SOURCE_USER,
+        options={
+            CONF_MIN_UPDATE_INTERVAL: NO_POLLING,
+            CONF_MAX_UPDATE_INTERVAL: NO_POLLING,
+        },
+    )
+
+    def _client(data: dict[str, Any], hass: HomeAssistant) -> SyntheticClient:
+        api = _api_from_config_entry_data(data)
+        return SyntheticClient(api, _acquire_session(hass, api.host), fleet)
+
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        patch(
+            "custom_components.ojmicroline_thermostat.coordinator."
+            "oj_microline_from_config_entry_data",
+            _client,
+        ),
+    ):
+        hass = await _async_start_hass(config_dir)
+        try:
+            await run(hass, entry)
+        finally:
+            await hass.async_stop(force=True)
+
+
+async def async_benchmark(
+    model: str, size: int, polls: int, change_rate: float, passes: int
+) -> dict[str, Any]:
+    """Measure one fleet size.
+
+    Args:
+    ----
+        model: MODEL_WD5_SERIES or MODEL_WG4_SERIES.
+        size: The number of thermostats.
+        polls: The number of polls to measure.
+        change_rate: The share of thermostats changing between polls.
+        passes: The number of forced and skipped updates and state reads
+            to measure.
+
+    Returns:
+    -------
+        The measurements.
+
+    """
+    result: dict[str, Any] = {"thermostats": size}
+    fleet = SyntheticFleet(model, size)
+
+    async def _timing(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> None:
+        start = time.perf_counter()
+        await hass.config_entries.async_add(entry)
+        await hass.async_block_till_done()
+        result["setup_s"] = time.perf_counter() - start
+        result["entities"] = len(hass.states.async_entity_ids())
+
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        update_data = coordinator._async_update_data  # noqa: SLF001
+        latencies: list[float] = []
+
+        async def _timed_update_data() -> Any:
+            start = time.perf_counter()
+            try:
+                return await update_data()
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+        coordinator._async_update_data = _timed_update_data  # noqa: SLF001
+
+        cpu: list[float] = []
+        wall: list[float] = []
+        writes: list[int] = []
+        skipped: list[int] = []
+        for _ in range(polls):
+            fleet.tick(change_rate)
+            cpu_start, wall_start = time.process_time(), time.perf_counter()
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+            cpu.append(time.process_time() - cpu_start)
+            wall.append(time.perf_counter() - wall_start)
+            writes.append(coordinator.stats.state_writes)
+            skipped.append(coordinator.stats.skipped_writes)
+
+        result["update_data_ms"] = _summary(latencies, 1000)
+        result["poll_cpu_ms"] = _summary(cpu, 1000)
+        result["poll_wall_ms"] = _summary(wall, 1000)
+        result["state_writes_per_update"] = statistics.fmean(writes)
+        result["skipped_writes_per_update"] = statistics.fmean(skipped)
+        await _async_measure_passes(hass, coordinator, passes, result)
+
+    async def _memory(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> None:
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            await hass.config_entries.async_add(entry)
+            await hass.async_block_till_done()
+            traced = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        result["memory_per_entity_kib"] = traced / 1024 / result["entities"]
+
+    await _async_with_entry(fleet, _timing)
+    await _async_with_entry(SyntheticFleet(model, size), _memory)
+    return result
+
+
+async def _async_measure_passes(
+    hass: HomeAssistant,
+    coordinator: OJMicrolineDataUpdateCoordinator,
+    passes: int,
+    result: dict[str, Any],
+) -> None:
+    """Measure the entity updates without polling.
+
+    Unknown changes make every entity write its state, as after a failed
+    update; an empty diff lets every entity skip its write, except those
+    whose values follow the clock. Together they show what an entity costs
+    per update with and without the diff stage. Reading the state
+    properties is the part of a write the entity itself controls.
+
+    Args:
+    ----
+        hass: The HomeAssistant instance.
+        coordinator: The coordinator of the fleet's entry.
+        passes: The number of passes per measurement.
+        result: The measurements to add to.
+
+    """
+    for name, changes in (("forced", None), ("skipped", {})):
+        cpu: list[float] = []
+        for _ in range(passes):
+            cpu_start = time.process_time()
+            coordinator.changes = None if changes is None else {}
+            coordinator.async_update_listeners()
+            await hass.async_block_till_done()
+            cpu.append(time.process_time() - cpu_start)
+        result[f"{name}_update_cpu_ms"] = _summary(cpu, 1000)
+        result[f"{name}_update_state_writes"] = coordinator.stats.state_writes
+
+    entities = [
+        entity
+        for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+    ]
+    cpu = []
+    for _ in range(passes):
+        cpu_start = time.process_time()
+        for entity in entities:
+            _ = entity.state, entity.state_attributes, entity.extra_state_attributes
+        cpu.append(time.process_time() - cpu_start)
+    result["state_reads_cpu_ms"] = _summary(cpu, 1000)
+
+
+def _summary(values: list[float], scale: float) -> dict[str, float]:
+    """Summarise measurements.
+
+    Args:
+    ----
+        values: The measurements.
+        scale: The factor to convert them to the reported unit.
+
+    Returns:
+    -------
+        The mean, median and maximum.
+
+    """
+    return {
+        "mean": statistics.fmean(values) * scale,
+        "p50": statistics.median(values) * scale,
+        "max": max(values) * scale,
+    }
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", choices=MODELS, default="wd5")
+    parser.add_argument(
+        "--sizes",
+        default="10,100,1000",
+        help="comma separated fleet sizes, e.g. 10,100,1000,5000",
+    )
+    parser.add_argument("--polls", type=int, default=5)
+    parser.add_argument(
+        "--change-rate",
+        type=float,
+        default=0.1,
+        help="share of thermostats whose readings change between polls",
+    )
+    parser.add_argument(
+        "--passes",
+        type=int,
+        default=100,
+        help="forced and skipped updates and state reads to measure",
+    )
+    parser.add_argument("--output", type=Path, help="write the JSON here")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    model = MODELS[args.model]
+    results = [
+        asyncio.run(
+            async_benchmark(model, int(size), args.polls, args.change_rate, args.passes)
+        )
+        for size in args.sizes.split(",")
+    ]
+    report = {
+        "model": model,
+        "polls": args.polls,
+        "change_rate": args.change_rate,
+        "passes": args.passes,
+        "python": platform.python_version(),
+        "homeassistant": HA_VERSION,
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""Emulate the OJ Microline cloud API on the local machine.
+
+Serves the login, thermostat, energy usage and regulation mode endpoints
+of the WD5 or WG4 API for a synthetic fleet, with configurable latency,
+errors, timeouts and write propagation delay. Writes are acknowledged
+immediately but only show up in reads after the propagation delay, like
+the stale reads after a write seen on the real backend.
+
+The client library always connects over verified HTTPS, so the emulator
+serves a self-signed certificate. It also writes a CA bundle with the
+usual certificates plus this one; start Home Assistant with
+REQUESTS_CA_BUNDLE pointing at it and add the integration with the
+emulator's address as host, for example 127.0.0.1:8443.
+
+Usage, from the repository root:
+
+    python -m scripts.emulator --model wd5 --size 50 --latency 0.3 --error-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import datetime as dt
+import ipaddress
+import logging
+import random
+import ssl
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+import certifi
+from aiohttp import web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from custom_components.ojmicroline_thermostat.const import (
+    API_TIMEOUT,
+    MODEL_WD5_SERIES,
+    MODEL_WG4_SERIES,
+)
+
+from .synthetic import SyntheticFleet
+
+_LOGGER = logging.getLogger(__name__)
+
+MODELS = {"wd5": MODEL_WD5_SERIES, "wg4": MODEL_WG4_SERIES}
+# The response to a write that was accepted, by model.
+WRITE_ACCEPTED = {
+    MODEL_WD5_SERIES: {"ErrorCode": 0},
+    MODEL_WG4_SERIES: {"Success": True},
+}
+CERT_DIR = Path(tempfile.gettempdir()) / "ojmicroline-emulator"
+
+
+class Emulator:
+    """Serve a synthetic fleet like the cloud API."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        fleet: SyntheticFleet,
+        *,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        timeout_rate: float = 0,
+        propagation_delay: float = 0,
+    ) -> None:
+        """Initialise the emulator.
+
+        Args:
+        ----
+            fleet: The thermostats to serve.
+            latency: Mean response time, in seconds.
+            jitter: Standard deviation of the response time, in seconds.
+            error_rate: Share of requests answered with HTTP 500.
+            timeout_rate: Share of requests that are not answered before
+                the integration's API timeout.
+            propagation_delay: Seconds before a write shows up in reads.
+
+        """
+        self.fleet = fleet
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.propagation_delay = propagation_delay
+        self.requests: Counter[str] = Counter()
+        self.rng = random.Random(fleet.seed)  # noqa: S311
+
+    def app(self) -> web.Application:
+        """Return the web application serving the fleet.
+
+        Returns
+        -------
+            The application.
+
+        """
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self.handle)
+        return app
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer a request.
+
+        Args:
+        ----
+            request: The HTTP request.
+
+        Returns:
+        -------
+            The JSON response, or an error.
+
+        """
+        path = request.match_info["path"]
+        self.requests[path] += 1
+        body = await request.json() if request.can_read_body else None
+        _LOGGER.debug("%s %s %s", request.method, path, dict(request.query))
+
+        delay = max(0.0, self.rng.gauss(self.latency, self.jitter))
+        roll = self.rng.random()
+        if roll < self.timeout_rate:
+            delay += API_TIMEOUT
+        await asyncio.sleep(delay)
+        if roll < self.timeout_rate + self.error_rate:
+            self.requests["errors"] += 1
+            raise web.HTTPInternalServerError
+
+        params = dict(request.query)
+        if path == self.fleet.paths["update"] and self.propagation_delay:
+            asyncio.get_running_loop().call_later(
+                self.propagation_delay, self.fleet.update, params, body or {}
+            )
+            return web.json_response(WRITE_ACCEPTED[self.fleet.model])
+        try:
+            return web.json_response(self.fleet.handle(path, params, body))
+        except KeyError as error:
+            raise web.HTTPNotFound from error
+
+    async def async_tick(self, interval: float, change_rate: float) -> None:
+        """Change readings of the fleet periodically.
+
+        Args:
+        ----
+            interval: Seconds between changes.
+            change_rate: Share of thermostats changing each time.
+
+        """
+        while True:
+            await asyncio.sleep(interval)
+            self.fleet.tick(change_rate)
+
+
+def ensure_certificate(directory: Path, host: str) -> tuple[Path, Path, Path]:
+    """Create a self-signed certificate for the host if there is none.
+
+    Args:
+    ----
+        directory: Where to keep the certificate.
+        host: The host name or IP address the emulator is reached at.
+
+    Returns:
+    -------
+        The certificate, the private key and the CA bundle with the
+        certificate added to the certifi certificates.
+
+    """
+    cert_file = directory / f"{host}.pem"
+    key_file = directory / f"{host}.key"
+    bundle_file = directory / "ca-bundle.pem"
+    if not cert_file.exists() or not key_file.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        key = ec.generate_private_key(ec.SECP256R1())
+        try:
+            san: x509.GeneralName = x509.IPAddress(ipaddress.ip_address(host))
+        except ValueError:
+            san = x509.DNSName(host)
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, host)])
+        now = dt.datetime.now(tz=dt.UTC)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - dt.timedelta(days=1))
+            .not_valid_after(now + dt.timedelta(days=365))
+            .add_extension(x509.SubjectAlternativeName([san]), critical=False)
+            .add_extension(
+                x509.BasicConstraints(ca=True, path_length=None), critical=True
+            )
+            .sign(key, hashes.SHA256())
+        )
+        cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+        key_file.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    bundle_file.write_text(
+        Path(certifi.where()).read_text(encoding="utf-8")
+        + cert_file.read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+    return cert_file, key_file, bundle_file
+
+
+async def async_serve(emulator: Emulator, args: argparse.Namespace) -> None:
+    """Serve the emulator until cancelled.
+
+    Args:
+    ----
+        emulator: The emulator to serve.
+        args: The command line arguments.
+
+    """
+    cert_file, key_file, bundle_file = ensure_certificate(args.cert_dir, args.host)
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+
+    runner = web.AppRunner(emulator.app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, args.host, args.port, ssl_context=context)
+    await site.start()
+    _LOGGER.info(
+        "Serving %s thermostats (%s) at %s:%s, start Home Assistant with "
+        "REQUESTS_CA_BUNDLE=%s",
+        emulator.fleet.size,
+        emulator.fleet.model,
+        args.host,
+        args.port,
+        bundle_file,
+    )
+    try:
+        await emulator.async_tick(args.tick_interval, args.change_rate)
+    finally:
+        _LOGGER.info("Requests served: %s", dict(emulator.requests))
+        await runner.cleanup()
+
+
+def main() -> None:
+    """Run the emulator from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", choices=MODELS, default="wd5")
+    parser.add_argument("--size", type=int, default=10, help="number of thermostats")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.05, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--timeout-rate", type=float, default=0)
+    parser.add_argument(
+        "--propagation-delay",
+        type=float,
+        default=3,
+        help="seconds before a write shows up in reads",
+    )
+    parser.add_argument("--tick-interval", type=float, default=60, help="seconds")
+    parser.add_argument("--change-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cert-dir", type=Path, default=CERT_DIR)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    emulator = Emulator(
+        SyntheticFleet(MODELS[args.model], args.size, args.seed),
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        propagation_delay=args.propagation_delay,
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(async_serve(emulator, args))
+
+
+if __name__ == "__main__":
+    main()
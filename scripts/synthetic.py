@@ -0,0 +1,343 @@
+"""Synthetic OJ Microline accounts that answer like the cloud API.
+
+A SyntheticFleet generates the JSON payloads of the WD5 or WG4 API for
+any number of thermostats and keeps their state, so writes show up in
+later reads. It is used in-process by the benchmark and over HTTP by the
+emulator.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from ojmicroline_thermostat.const import (
+    REGULATION_COMFORT,
+    REGULATION_MANUAL,
+    REGULATION_SCHEDULE,
+    SENSOR_ROOM_FLOOR,
+    WD5_DATETIME_FORMAT,
+)
+
+from custom_components.ojmicroline_thermostat.const import (
+    MODEL_WD5_SERIES,
+    MODEL_WG4_SERIES,
+)
+
+WD5_PATHS = {
+    "login": "api/UserProfile/SignIn",
+    "thermostats": "api/Group/GroupContents",
+    "energy": "api/EnergyUsage/GetEnergyUsage",
+    "update": "api/Group/UpdateGroup",
+}
+WG4_PATHS = {
+    "login": "api/authenticate/user",
+    "thermostats": "api/thermostats",
+    "update": "api/thermostat",
+}
+
+SESSION_ID = "synthetic-session"
+# Thermostats per zone, like rooms on a floor.
+ZONE_SIZE = 4
+# Clock times of the schedule events, every day of the week.
+SCHEDULE_CLOCKS = ("06:00:00", "08:00:00", "12:00:00", "17:00:00", "22:00:00")
+
+WG4_DATETIME_FORMAT = "%d/%m/%Y %H:%M:%S +00:00"
+
+
+@dataclass
+class SyntheticFleet:
+    """The thermostats of one synthetic account.
+
+    Args:
+    ----
+        model: MODEL_WD5_SERIES or MODEL_WG4_SERIES.
+        size: The number of thermostats.
+        seed: The seed of the random changes, so runs are repeatable.
+
+    """
+
+    model: str
+    size: int
+    seed: int = 0
+    thermostats: dict[str, dict[str, Any]] = field(init=False)
+    rng: random.Random = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Generate the thermostats."""
+        if self.model not in {MODEL_WD5_SERIES, MODEL_WG4_SERIES}:
+            msg = f"Unknown model {self.model}"
+            raise ValueError(msg)
+        self.rng = random.Random(self.seed)  # noqa: S311
+        build = self._wd5_item if self.model == MODEL_WD5_SERIES else self._wg4_item
+        self.thermostats = {}
+        for index in range(self.size):
+            item = build(index)
+            self.thermostats[item["SerialNumber"]] = item
+
+    @property
+    def paths(self) -> dict[str, str]:
+        """Return the API paths of the model.
+
+        Returns
+        -------
+            The path of each endpoint by name.
+
+        """
+        return WD5_PATHS if self.model == MODEL_WD5_SERIES else WG4_PATHS
+
+    def tick(self, change_rate: float) -> int:
+        """Change the readings of a share of the thermostats.
+
+        Args:
+        ----
+            change_rate: The share of thermostats to change, from 0 to 1.
+
+        Returns:
+        -------
+            The number of thermostats that changed.
+
+        """
+        changed = self.rng.sample(
+            list(self.thermostats.values()), round(self.size * change_rate)
+        )
+        for item in changed:
+            step = self.rng.choice((-10, 10))
+            if self.model == MODEL_WD5_SERIES:
+                item["RoomTemperature"] += step
+                item["FloorTemperature"] += step
+            else:
+                item["Temperature"] += step
+            item["Heating"] = self.rng.random() < 0.5
+        return len(changed)
+
+    def handle(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> Any:
+        """Answer a request like the cloud API.
+
+        Args:
+        ----
+            path: The request path without the leading slash.
+            params: The query parameters.
+            body: The JSON body.
+
+        Returns:
+        -------
+            The JSON response.
+
+        Raises:
+        ------
+            KeyError: The path is not an endpoint of the model.
+
+        """
+        params = params or {}
+        body = body or {}
+        if path == self.paths["login"]:
+            return {"ErrorCode": 0, "SessionId": SESSION_ID}
+        if path == self.paths["thermostats"]:
+            return self.thermostats_response()
+        if path == self.paths.get("energy"):
+            return self.energy_response(str(body.get("ThermostatID")))
+        if path == self.paths["update"]:
+            return self.update(params, body)
+        raise KeyError(path)
+
+    def thermostats_response(self) -> dict[str, Any]:
+        """Return the thermostats grouped by zone.
+
+        Returns
+        -------
+            The GroupContents (WD5) or thermostats (WG4) response.
+
+        """
+        groups: dict[int, list[dict[str, Any]]] = {}
+        for item in self.thermostats.values():
+            groups.setdefault(item["GroupId"], []).append(item)
+        if self.model == MODEL_WD5_SERIES:
+            return {
+                "ErrorCode": 0,
+                "GroupContents": [
+                    {"GroupId": zone_id, "Thermostats": items}
+                    for zone_id, items in groups.items()
+                ],
+            }
+        return {
+            "Groups": [
+                {"GroupId": zone_id, "Thermostats": items}
+                for zone_id, items in groups.items()
+            ]
+        }
+
+    def energy_response(self, serial_number: str) -> dict[str, Any]:
+        """Return the energy usage of today and the six days before.
+
+        Args:
+        ----
+            serial_number: The serial number of the thermostat.
+
+        Returns:
+        -------
+            The GetEnergyUsage response.
+
+        """
+        base = int(serial_number[2:]) % 7
+        usage = [
+            {"EnergyKWattHour": round(0.5 + base + day * 0.25, 2)} for day in range(7)
+        ]
+        return {"ErrorCode": 0, "EnergyUsage": [{"Usage": usage}]}
+
+    def update(self, params: dict[str, Any], body: dict[str, Any]) -> dict[str, Any]:
+        """Apply a regulation mode write.
+
+        A WD5 write updates every thermostat of the group, like the real
+        UpdateGroup endpoint.
+
+        Args:
+        ----
+            params: The query parameters.
+            body: The JSON body.
+
+        Returns:
+        -------
+            The update response.
+
+        """
+        if self.model == MODEL_WG4_SERIES:
+            item = self.thermostats.get(str(params.get("serialnumber")))
+            if item is None:
+                return {"Success": False}
+            item.update(
+                {
+                    key: value
+                    for key, value in body.items()
+                    if key in item and value is not None
+                }
+            )
+            if "ManualTemperature" in body:
+                item["SetPointTemp"] = body["ManualTemperature"]
+            if "ComfortTemperature" in body:
+                item["SetPointTemp"] = body["ComfortTemperature"]
+            return {"Success": True}
+
+        group = body.get("SetGroup", {})
+        members = [
+            item
+            for item in self.thermostats.values()
+            if item["GroupId"] == group.get("GroupId")
+        ]
+        if not members:
+            return {"ErrorCode": 1}
+        for item in members:
+            item.update(
+                {
+                    key: value
+                    for key, value in group.items()
+                    if key in item and value is not None
+                }
+            )
+        return {"ErrorCode": 0}
+
+    def _wd5_item(self, index: int) -> dict[str, Any]:
+        """Return the payload of a WD5 thermostat."""
+        now = datetime.now(tz=UTC)
+        zone_id = index // ZONE_SIZE
+        mode = self.rng.choice(
+            (REGULATION_SCHEDULE, REGULATION_MANUAL, REGULATION_COMFORT)
+        )
+        return {
+            "Id": index,
+            "SerialNumber": f"SN{index:06d}",
+            "SWversion": "1060",
+            "GroupName": f"Zone {zone_id}",
+            "GroupId": zone_id,
+            "ThermostatName": f"Thermostat {index}",
+            "Online": True,
+            "Heating": self.rng.random() < 0.3,
+            "RegulationMode": mode,
+            "SensorAppl": SENSOR_ROOM_FLOOR,
+            "AdaptiveMode": True,
+            "OpenWindow": False,
+            "LastPrimaryModeIsAuto": mode == REGULATION_SCHEDULE,
+            "DaylightSavingActive": False,
+            "FloorTemperature": 2000 + self.rng.randrange(0, 300, 10),
+            "RoomTemperature": 1900 + self.rng.randrange(0, 300, 10),
+            "MinSetpoint": 500,
+            "MaxSetpoint": 4000,
+            "ComfortSetpoint": 2300,
+            "ManualModeSetpoint": 2100,
+            "FrostProtectionTemperature": 500,
+            "BoostEndTime": _wd5_date(now - timedelta(days=1)),
+            "ComfortEndTime": _wd5_date(now + timedelta(hours=2)),
+            "VacationEnabled": False,
+            "VacationBeginDay": _wd5_date(now - timedelta(days=30)),
+            "VacationEndDay": _wd5_date(now - timedelta(days=23)),
+            "VacationTemperature": 1200,
+            "TimeZone": 0,
+            "Schedule": _wd5_schedule(zone_id),
+        }
+
+    def _wg4_item(self, index: int) -> dict[str, Any]:
+        """Return the payload of a WG4 thermostat."""
+        now = datetime.now(tz=UTC)
+        zone_id = index // ZONE_SIZE
+        mode = self.rng.choice((REGULATION_SCHEDULE, REGULATION_MANUAL))
+        set_point = 2100
+        return {
+            "SerialNumber": f"SN{index:06d}",
+            "SWVersion": "1.0",
+            "GroupName": f"Zone {zone_id}",
+            "GroupId": zone_id,
+            "Room": f"Thermostat {index}",
+            "Online": True,
+            "Heating": self.rng.random() < 0.3,
+            "RegulationMode": mode,
+            "LastPrimaryModeIsAuto": mode == REGULATION_SCHEDULE,
+            "Temperature": 1900 + self.rng.randrange(0, 300, 10),
+            "SetPointTemp": set_point,
+            "MinTemp": 500,
+            "MaxTemp": 4000,
+            "ComfortTemperature": 2300,
+            "ManualTemperature": set_point,
+            "ComfortEndTime": (now + timedelta(hours=2)).strftime(WG4_DATETIME_FORMAT),
+            "VacationEnabled": False,
+            "VacationBeginDay": (now - timedelta(days=30)).strftime(
+                "%d/%m/%Y %H:%M:%S"
+            ),
+            "VacationEndDay": (now - timedelta(days=23)).strftime("%d/%m/%Y %H:%M:%S"),
+            "VacationTemperature": 1200,
+            "TZOffset": "+00:00",
+        }
+
+
+def _wd5_date(value: datetime) -> str:
+    """Format a date like the WD5 API."""
+    return value.strftime(WD5_DATETIME_FORMAT)
+
+
+def _wd5_schedule(zone_id: int) -> dict[str, Any]:
+    """Return the weekly schedule shared by the thermostats of a zone."""
+    return {
+        "Days": [
+            {
+                "WeekDayGrpNo": day,
+                "Events": [
+                    {
+                        "ScheduleType": 0,
+                        "Clock": clock,
+                        "Temperature": 1800 + 100 * ((zone_id + index) % 5),
+                        "Active": True,
+                        "EventIsOnNextDay": False,
+                    }
+                    for index, clock in enumerate(SCHEDULE_CLOCKS)
+                ],
+            }
+            for day in range(7)
+        ],
+        "ModeDays": 0,
+    }